@@ -3,14 +3,55 @@ Base DataWarehouse classes
 """
 from __future__ import annotations
 from abc import ABC
+from functools import lru_cache
 import re
 import os
-from typing import List, Optional, Tuple, Union
-from collections import namedtuple
+import time
+from typing import Any, Callable, List, Optional, Tuple, Union
+from collections import namedtuple, OrderedDict
 
 import pandas as pd
 
+from rasgoql.utils.creds import clear_env_cache
+
 FQTN = namedtuple("FQTN", ["database", "schema", "table"], defaults=(None, None, None))
+FQTN_PATTERN = re.compile(r'^[^\s]+\.[^\s]+\.[^\s]+')
+NAMESPACE_PATTERN = re.compile(r'^[^\s]+\.[^\s]+')
+
+
+@lru_cache(maxsize=4096)
+def _parse_fqtn(
+    fqtn: str,
+    default_namespace: Optional[str],
+    strict: bool,
+) -> FQTN:
+    """
+    Splits a possible fqtn into its parts for DataWarehouse.parse_fqtn
+    A workflow resolves the same few names over and over, so answers are memoized
+    """
+    if strict:
+        if not FQTN_PATTERN.match(fqtn):
+            raise ValueError(f'{fqtn} is not a well-formed fqtn')
+        return FQTN(*fqtn.split("."))
+
+    parts = fqtn.split(".")
+    if len(parts) == 3:
+        return FQTN(*parts)
+
+    if not default_namespace or len(parts) > 3:
+        raise ValueError(f'{fqtn} is not a well-formed fqtn')
+
+    if not NAMESPACE_PATTERN.match(default_namespace):
+        raise ValueError(f'{default_namespace} is not a well-formed namespace')
+    database, schema = default_namespace.split(".")
+
+    if len(parts) == 2:
+        return FQTN(database, *parts)
+    return FQTN(database, schema, fqtn)
+
+
+# Statements that only read, and so cannot change which tables exist
+READ_ONLY_PREFIXES = ("select", "with", "show", "desc")
 
 
 class DWCredentials(ABC):
@@ -40,6 +81,13 @@ class DWCredentials(ABC):
         """
         raise NotImplementedError()
 
+    @staticmethod
+    def clear_env_cache():
+        """
+        Forces the next `from_env` call to re-read its .env file
+        """
+        clear_env_cache()
+
     def to_dict(self) -> dict:
         """
         Returns a dict of the credentials
@@ -67,30 +115,51 @@ class DWCredentials(ABC):
         if not prefix.endswith("_"):
             prefix = f"{prefix}_"
 
+        prefix_len = len(prefix)
         env_vars = {}
         for var_name, value in os.environ.items():
-            if var_name.upper().startswith(prefix):
-                # Convert Booleans
-                if value.lower().strip() in ("false", "true"):
-                    value = False if value.lower().strip() == "false" else True
-                # Convert Integers
-                elif value.strip().isnumeric():
-                    value = int(value.strip())
-                env_vars[var_name.lower()[len(prefix) :]] = value
+            # Only case-fold the prefix slice, not every full variable name
+            if var_name[:prefix_len].upper() != prefix:
+                continue
+            stripped = value.strip()
+            # Convert Booleans
+            if stripped.lower() in ("false", "true"):
+                value = stripped.lower() == "true"
+            # Convert Integers
+            elif stripped.isnumeric():
+                value = int(stripped)
+            env_vars[var_name[prefix_len:].lower()] = value
         return env_vars
 
 
 class DataWarehouse(ABC):
     """
     Base DW Class
+
+    Table existence lookups are cached for object_cache_ttl seconds. Only
+    tables found to exist are cached: a missing table is always asked about
+    again, so a write never runs CREATE OR REPLACE on a stale "missing" answer.
+    Set object_cache_ttl to 0 to turn the cache off, or call clear_object_cache
+    after changing tables outside of this connection
     """
 
     dw_type = None
     credentials_class = DWCredentials
+    # Seconds a table lookup is trusted before asking the DW again (0 disables
+    # the cache), and how many table names to remember at once
+    object_cache_ttl: float = 30
+    object_cache_size: int = 512
 
     def __init__(self):
         self.credentials = None
         self.connection = None
+        self._object_cache: OrderedDict[str, Tuple[float, Any]] = OrderedDict()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close_connection()
 
     # ---------------------------
     # FQTN and namespace methods
@@ -104,6 +173,8 @@ class DataWarehouse(ABC):
         Makes all of your wildest dreams come true... well not *that* one
         """
         input_db, input_schema, table = self.parse_fqtn(possible_fqtn, default_namespace, False)
+        if input_db and input_schema:
+            return self.make_fqtn(input_db, input_schema, table)
         default_database, default_schema = self.parse_namespace(default_namespace)
         database = input_db or default_database
         schema = input_schema or default_schema
@@ -139,23 +210,7 @@ class DataWarehouse(ABC):
         """
         Accepts a possible fully qualified table string and returns its component parts
         """
-        if strict:
-            fqtn = self.validate_fqtn(fqtn)
-            return FQTN(*fqtn.split("."))
-
-        if fqtn.count(".") == 2:
-            return FQTN(*fqtn.split("."))
-
-        if not default_namespace:
-            raise ValueError(f'{fqtn} is not a well-formed fqtn')
-
-        database, schema = self.parse_namespace(default_namespace)
-
-        if fqtn.count(".") == 1:
-            return FQTN(database, *fqtn.split("."))
-        if fqtn.count(".") == 0:
-            return FQTN(database, schema, fqtn)
-        raise ValueError(f'{fqtn} is not a well-formed fqtn')
+        return _parse_fqtn(fqtn, default_namespace, strict)
 
     def parse_namespace(
         self,
@@ -174,7 +229,7 @@ class DataWarehouse(ABC):
         """
         Accepts a possible fully qualified table string and decides whether it is well-formed
         """
-        if re.match(r'^[^\s]+\.[^\s]+\.[^\s]+', fqtn):
+        if FQTN_PATTERN.match(fqtn):
             return fqtn
         raise ValueError(f'{fqtn} is not a well-formed fqtn')
 
@@ -185,7 +240,7 @@ class DataWarehouse(ABC):
         """
         Accepts a possible namespace string and decides whether it is well-formed
         """
-        if re.match(r'^[^\s]+\.[^\s]+', namespace):
+        if NAMESPACE_PATTERN.match(namespace):
             return namespace
         raise ValueError(f'{namespace} is not a well-formed namespace')
 
@@ -314,9 +369,50 @@ class DataWarehouse(ABC):
         """
         raise NotImplementedError()
 
+    def clear_object_cache(self) -> None:
+        """
+        Forget all cached table lookups
+        Call this after tables are created or dropped outside of this connection
+        """
+        self._object_cache.clear()
+
     # ---------------------------
     # Core Data Warehouse helpers
     # ---------------------------
+    def _cached_lookup(
+        self,
+        fqtn: str,
+        lookup: Callable[[str], Any],
+        exists: Callable[[Any], bool] = bool,
+    ) -> Any:
+        """
+        Return lookup(fqtn), reusing the answer for object_cache_ttl seconds
+        Only answers where exists(answer) is true are kept
+        Past object_cache_size names, the oldest answer is dropped
+        """
+        cached = self._object_cache.get(fqtn)
+        if cached and time.monotonic() - cached[0] < self.object_cache_ttl:
+            return cached[1]
+        value = lookup(fqtn)
+        if exists(value):
+            self._remember_object(fqtn, value)
+        else:
+            self._object_cache.pop(fqtn, None)
+        return value
+
+    def _remember_object(
+        self,
+        fqtn: str,
+        value: Any,
+    ) -> None:
+        """
+        Cache the lookup answer for fqtn, e.g. right after this connection creates it
+        """
+        self._object_cache.pop(fqtn, None)
+        self._object_cache[fqtn] = (time.monotonic(), value)
+        if len(self._object_cache) > self.object_cache_size:
+            self._object_cache.popitem(last=False)
+
     @staticmethod
     def _is_select_statement(
         sql: str,
@@ -19,7 +19,7 @@ from rasgoql.errors import (
     TableAccessError,
     TableConflictException,
 )
-from rasgoql.imports import bq, gcp_exc, gcp_flow, gcp_svc
+from rasgoql.imports import bq, gcp_exc, gcp_flow, gcp_svc, pa
 from rasgoql.primitives.enums import check_response_type, check_write_method, check_write_table_type
 from rasgoql.utils.creds import load_env, save_env
 from rasgoql.utils.df import cleanse_sql_dataframe
@@ -142,20 +142,14 @@ class BigQueryDataWarehouse(DataWarehouse):
         `namespace`: str:
             namespace (project.dataset)
         """
-        namespace = self.validate_namespace(namespace)
-        project, dataset = self.parse_namespace(namespace)
-        try:
-            self.execute_query(f'USE PROJECT {project}')
-            self.execute_query(f'USE DATASET {dataset}')
-            self.default_namespace = namespace
-            self.default_project = project
-            self.default_dataset = dataset
-            verbose_message(
-                f"Namespace reset to {self.default_namespace}",
-                logger,
-            )
-        except Exception as e:
-            self._error_handler(e)
+        # Queries pick up the namespace from _default_job_config,
+        # so there is no session state to change on the server
+        self.default_namespace = namespace
+        verbose_message(
+            "Namespace reset to %s",
+            logger,
+            self.default_namespace,
+        )
 
     def connect(
         self,
@@ -227,7 +221,7 @@ class BigQueryDataWarehouse(DataWarehouse):
         """
         table_type = check_write_table_type(table_type)
         fqtn = self.magic_fqtn_handler(fqtn, self.default_namespace)
-        if self._table_exists(fqtn) and not overwrite:
+        if not overwrite and self._table_exists(fqtn):
             msg = (
                 f'A table or view named {fqtn} already exists. '
                 'If you are sure you want to overwrite it, '
@@ -271,14 +265,14 @@ class BigQueryDataWarehouse(DataWarehouse):
         `sql`: str:
             query text to execute
         `response`: str:
-            Possible values: [dict, df, None]
+            Possible values: [arrow, dict, df, None]
         `acknowledge_risk`: bool:
             pass True when you know your SQL statement contains
             a potentially dangerous or data-altering operation
             and still want to run it against your DataWarehouse
         """
         response = check_response_type(response)
-        if is_scary_sql(sql) and not acknowledge_risk:
+        if not acknowledge_risk and is_scary_sql(sql):
             msg = (
                 'It looks like your SQL statement contains a '
                 'potentially dangerous or data-altering operation.'
@@ -287,13 +281,16 @@ class BigQueryDataWarehouse(DataWarehouse):
             )
             raise SQLWarning(msg)
         verbose_message(
-            f"Executing query: {sql}",
+            "Executing query: %s",
             logger,
+            sql,
         )
         if response == 'DICT':
             return self._query_into_dict(sql)
         if response == 'DF':
             return self._query_into_pandas(sql)
+        if response == 'ARROW':
+            return self._query_into_arrow(sql)
         return self._execute_string(sql, ignore_results=(response == 'NONE'))
 
     def get_ddl(
@@ -309,7 +306,7 @@ class BigQueryDataWarehouse(DataWarehouse):
         fqtn = self.magic_fqtn_handler(fqtn, self.default_namespace)
         proj, ds, tbl = self.parse_fqtn(fqtn)
         sql = f"SELECT DDL FROM {proj}.{ds}.INFORMATION_SCHEMA.TABLES WHERE TABLE_NAME='{tbl}'"
-        query_response = self.execute_query(sql)
+        query_response = self.execute_query(sql, acknowledge_risk=True)
         return query_response[0]
 
     def get_object_details(
@@ -452,6 +449,7 @@ class BigQueryDataWarehouse(DataWarehouse):
         Params:
         `df`: pandas DataFrame:
             DataFrame to upload
+            its column names are made SQL compliant in place, without a copy
         `fqtn`: str:
             Fully-qualied table name (database.schema.table)
             Name for the new table
@@ -497,9 +495,9 @@ class BigQueryDataWarehouse(DataWarehouse):
 
         Params:
         `fqtn`: str:
-            Fully-qualified table name (database.schema.table)
+            Fully-qualified table name (database.schema.table), already
+            resolved by the calling method's magic_fqtn_handler
         """
-        fqtn = self.magic_fqtn_handler(fqtn, self.default_namespace)
         try:
             self.connection.get_table(fqtn)
             return True
@@ -521,7 +519,7 @@ class BigQueryDataWarehouse(DataWarehouse):
         """
         Handle Snowflake exceptions that need additional info
         """
-        verbose_message(f'Exception occurred while running query: {query}', logger),
+        verbose_message('Exception occurred while running query: %s', logger, query)
         if exception is None:
             return
         if isinstance(exception, gcp_exc.NotFound):
@@ -615,6 +613,25 @@ class BigQueryDataWarehouse(DataWarehouse):
         except Exception as e:
             self._error_handler(e)
 
+    def _query_into_arrow(
+        self,
+        query: str,
+    ) -> 'pa.Table':
+        """
+        Return results of query in a pyarrow Table
+        """
+        try:
+            return (
+                self.connection.query(
+                    query,
+                    job_config=self._default_job_config,
+                )
+                .result()
+                .to_arrow()
+            )
+        except Exception as e:
+            self._error_handler(e)
+
     def _query_into_pandas(
         self,
         query: str,
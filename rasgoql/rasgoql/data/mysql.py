@@ -4,11 +4,10 @@ MySQL DataWarehouse classes
 import logging
 import os
 import re
-from typing import Union
+from typing import Tuple, Union
 from urllib.parse import quote_plus as urlquote
 
 import json
-import pandas as pd
 
 from rasgoql.data.base import DWCredentials
 from rasgoql.data.sqlalchemy import SQLAlchemyDataWarehouse
@@ -17,17 +16,18 @@ from rasgoql.errors import (
     DWCredentialsWarning,
     PackageDependencyWarning,
     TableConflictException,
-    ParameterException,
 )
-from rasgoql.imports import alchemy_engine, alchemy_session
+from rasgoql.imports import alchemy_engine
 from rasgoql.primitives.enums import check_table_type
 from rasgoql.utils.creds import load_env, save_env
-from rasgoql.utils.messaging import verbose_message
 
 logging.basicConfig()
 logger = logging.getLogger("MySQL DataWarehouse")
 logger.setLevel(logging.INFO)
 
+# MySQL FQTNs are only "DB"."TABLE"
+FQTN_PATTERN = re.compile(r'^[^\s]+\.[^\s]+')
+
 
 class MySQLCredentials(DWCredentials):
     """
@@ -126,9 +126,10 @@ class MySQLDataWarehouse(SQLAlchemyDataWarehouse):
         Makes all of your wildest dreams come true... well not *that* one
         """
         input_db, table = self.parse_fqtn(possible_fqtn, default_namespace, False)
+        if input_db:
+            return self.make_fqtn(input_db, table)
         default_database = self.parse_namespace(default_namespace)
-        database = input_db or default_database
-        return self.make_fqtn(database, table)
+        return self.make_fqtn(default_database, table)
 
     def make_fqtn(
         self,
@@ -162,11 +163,11 @@ class MySQLDataWarehouse(SQLAlchemyDataWarehouse):
         if strict:
             fqtn = self.validate_fqtn(fqtn)
             return (*fqtn.split("."),)
-        database = self.parse_namespace(default_namespace)
-        if fqtn.count(".") == 1:
-            return (*fqtn.split("."),)
-        if fqtn.count(".") == 0:
-            return (database, fqtn)
+        parts = fqtn.split(".")
+        if len(parts) == 2:
+            return tuple(parts)
+        if len(parts) == 1:
+            return (self.parse_namespace(default_namespace), fqtn)
         raise ValueError(f'{fqtn} is not a well-formed fqtn')
 
     def parse_namespace(
@@ -183,7 +184,7 @@ class MySQLDataWarehouse(SQLAlchemyDataWarehouse):
         """
         Accepts a possible fully qualified table string and decides whether it is well-formed
         """
-        if re.match(r'^[^\s]+\.[^\s]+', fqtn):
+        if FQTN_PATTERN.match(fqtn):
             return fqtn
         raise ValueError(f'{fqtn} is not a well-formed fqtn')
 
@@ -261,52 +262,18 @@ class MySQLDataWarehouse(SQLAlchemyDataWarehouse):
         """
         table_type = check_table_type(table_type)
         fqtn = self.magic_fqtn_handler(fqtn, self.default_namespace)
-        if self._table_exists(fqtn=fqtn) and not overwrite:
-            msg = (
-                f"A table or view named {fqtn} already exists. "
-                "If you are sure you want to overwrite it, "
-                "pass in overwrite=True and run this function again"
-            )
-            raise TableConflictException(msg)
-        query = f"CREATE OR REPLACE {table_type} {fqtn} AS {sql}"
-        self.execute_query(query, acknowledge_risk=True, response="None")
+        with self._connection():
+            if not overwrite and self._table_exists(fqtn=fqtn):
+                msg = (
+                    f"A table or view named {fqtn} already exists. "
+                    "If you are sure you want to overwrite it, "
+                    "pass in overwrite=True and run this function again"
+                )
+                raise TableConflictException(msg)
+            query = f"CREATE OR REPLACE {table_type} {fqtn} AS {sql}"
+            self.execute_query(query, acknowledge_risk=True, response="None")
         return fqtn
 
-    def get_ddl(self, fqtn: str) -> pd.DataFrame:
-        """
-        Returns a DataFrame describing the column in the table
-
-        `fqtn`: str:
-            Fully-qualified Table Name (database.schema.table)
-        """
-        fqtn = self.magic_fqtn_handler(fqtn, self.default_namespace)
-        db, table_name = self.parse_fqtn(fqtn, default_namespace=self.default_namespace, strict=False)
-        sql = f"SHOW CREATE TABLE {db}.{table_name}"
-        query_response = self.execute_query(sql, response="DF")
-        return query_response
-
-    def get_object_details(self, fqtn: str) -> tuple:
-        """
-        Return details of a table or view in MySQL
-
-        Params:
-        `fqtn`: str:
-            Fully-qualified table name (database.schema.table)
-
-        Response:
-            object exists: bool
-            is rasgo object: bool
-            object type: [table|view|unknown]
-        """
-        fqtn = self.magic_fqtn_handler(fqtn, self.default_namespace)
-        db, table = self.parse_fqtn(fqtn, default_namespace=self.default_namespace, strict=False)
-        sql = f"SHOW TABLES IN {db} LIKE '{table}'"
-        result = self.execute_query(sql, response="dict")
-        obj_exists = len(result) > 0
-        is_rasgo_obj = False
-        obj_type = "unknown"
-        return obj_exists, is_rasgo_obj, obj_type
-
     # TODO: delete unused code?
     # def preview(self, sql: str = None, limit: int = 10) -> pd.DataFrame:
     #     """
@@ -334,10 +301,23 @@ class MySQLDataWarehouse(SQLAlchemyDataWarehouse):
     # --------------------------
     # MySQL specific helpers
     # --------------------------
+    def _ddl_sql(self, schema: str, table: str) -> Tuple[str, None]:
+        """
+        Returns the query that shows the create statement of a MySQL table
+        In MySQL the database acts as the schema
+        """
+        return f"SHOW CREATE TABLE {schema}.{table}", None
+
+    def _object_exists_sql(self, schema: str, table: str) -> Tuple[str, dict]:
+        """
+        Returns the query that finds a MySQL table or view by name
+        """
+        return f"SHOW TABLES IN {schema} LIKE :table", {"table": table}
+
     @property
     def _engine(self) -> "alchemy_engine":
         """
-        Returns a SQLAlchemy engine
+        Returns a new SQLAlchemy engine
         """
         engine_url = (
             f"{self.credentials.get('dw_type')}"
@@ -347,4 +327,4 @@ class MySQLDataWarehouse(SQLAlchemyDataWarehouse):
             f"@{self.credentials.get('host')}/"
             f"{self.credentials.get('database')}"
         )
-        return alchemy_engine(engine_url)
+        return alchemy_engine(engine_url, **self.pool_options)
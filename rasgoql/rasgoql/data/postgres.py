@@ -1,12 +1,15 @@
 """
 Postgres DataWarehouse classes
 """
+from contextlib import contextmanager
+import csv
+import io
 import logging
 import os
-from typing import Union
+import threading
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
 from urllib.parse import quote_plus as urlquote
 
-import json
 import pandas as pd
 
 from rasgoql.data.base import DWCredentials
@@ -17,15 +20,27 @@ from rasgoql.errors import (
     PackageDependencyWarning,
     TableConflictException,
 )
-from rasgoql.imports import alchemy_engine, alchemy_session
+from rasgoql.imports import adbc_postgres, alchemy_connection, alchemy_engine, alchemy_exceptions, pa
 from rasgoql.primitives.enums import check_table_type
 from rasgoql.utils.creds import load_env, save_env
-from rasgoql.utils.messaging import verbose_message
 
 logging.basicConfig()
 logger = logging.getLogger("Postgres DataWarehouse")
 logger.setLevel(logging.INFO)
 
+# Marks NULL values in the CSV that save_df streams through COPY
+COPY_NULL = "\\N"
+
+# SQLSTATE Postgres raises when creating a relation whose name is taken
+DUPLICATE_TABLE = "42P07"
+
+TABLE_EXISTS_SQL = "SELECT to_regclass(format('%I.%I', :schema, :table))"
+OBJECT_EXISTS_SQL = (
+    "SELECT c.relkind FROM pg_catalog.pg_class c JOIN "
+    "pg_catalog.pg_namespace n ON n.oid = c.relnamespace WHERE "
+    "n.nspname = :schema AND c.relname = :table"
+)
+
 
 class PostgresCredentials(DWCredentials):
     """
@@ -57,14 +72,9 @@ class PostgresCredentials(DWCredentials):
         self.schema = schema
 
     def __repr__(self) -> str:
-        return json.dumps(
-            {
-                "user": self.username,
-                "host": self.host,
-                "port": self.port,
-                "database": self.database,
-                "schema": self.schema,
-            }
+        return (
+            f"PostgresCredentials(user={self.username!r}, host={self.host!r}, port={self.port!r}, "
+            f"database={self.database!r}, schema={self.schema!r})"
         )
 
     @classmethod
@@ -73,18 +83,18 @@ class PostgresCredentials(DWCredentials):
         Creates an instance of this Class from a .env file on your machine
         """
         load_env(filepath)
-        username = os.getenv("POSTGRES_USERNAME")
-        password = os.getenv("POSTGRES_PASSWORD")
-        host = os.getenv("POSTGRES_HOST")
-        port = os.getenv("POSTGRES_PORT")
-        database = os.getenv("POSTGRES_DATABASE")
-        schema = os.getenv("POSTGRES_SCHEMA")
-        if not all([username, password, host, port, database, schema]):
+        env = os.environ
+        creds = {
+            key: env.get(f"POSTGRES_{key.upper()}")
+            for key in ("username", "password", "host", "port", "database", "schema")
+        }
+        missing = [f"POSTGRES_{key.upper()}" for key, value in creds.items() if not value]
+        if missing:
             raise DWCredentialsWarning(
-                "Your env file is missing expected credentials. Consider running "
-                "PostgresCredentials(*args).to_env() to repair this."
+                f"Your env file is missing expected credential variables {', '.join(missing)}. "
+                "Consider running PostgresCredentials(*args).to_env() to repair this."
             )
-        return cls(username, password, host, port, database, schema)
+        return cls(**creds)
 
     def to_dict(self) -> dict:
         """
@@ -115,6 +125,51 @@ class PostgresCredentials(DWCredentials):
         return save_env(creds, filepath, overwrite)
 
 
+def insert_with_copy(
+    table: "pd.io.sql.SQLTable",
+    conn: "alchemy_connection",
+    keys: List[str],
+    data_iter: Iterable[tuple],
+):
+    """
+    DataFrame.to_sql insertion method that streams each chunk to Postgres
+    as CSV through a single COPY ... FROM STDIN, so rows are not parsed
+    and planned as individual INSERT statements
+    """
+    preparer = conn.dialect.identifier_preparer
+    target = preparer.quote(table.name)
+    if table.schema:
+        target = f"{preparer.quote_schema(table.schema)}.{target}"
+    columns = ", ".join(preparer.quote(key) for key in keys)
+    # csv writes None and "" the same way, so mark NULLs explicitly
+    rows = ((COPY_NULL if value is None else value for value in row) for row in data_iter)
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    buffer.seek(0)
+    with conn.connection.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {target} ({columns}) FROM STDIN WITH (FORMAT csv, NULL '{COPY_NULL}')",
+            buffer,
+        )
+
+
+def describe_select(conn: "alchemy_connection", sql: str) -> List[Tuple[str, str]]:
+    """
+    Returns the (name, type) of each column a SELECT statement produces
+    Runs the query with LIMIT 0 and names the type OIDs from the cursor description
+    with format_type, so no probe view is created
+    """
+    result = conn.exec_driver_sql(f"SELECT * FROM ({sql.strip().rstrip(';')}) AS rql_describe LIMIT 0")
+    columns = [(column[0], int(column[1])) for column in result.cursor.description]
+    result.close()
+    if not columns:
+        return []
+    oids = sorted({oid for _, oid in columns})
+    type_names = conn.exec_driver_sql("SELECT " + ", ".join(f"format_type({oid}, NULL)" for oid in oids)).first()
+    type_by_oid = dict(zip(oids, type_names))
+    return [(name, type_by_oid[oid]) for name, oid in columns]
+
+
 class PostgresDataWarehouse(SQLAlchemyDataWarehouse):
     """
     Postgres DataWarehouse
@@ -122,22 +177,15 @@ class PostgresDataWarehouse(SQLAlchemyDataWarehouse):
 
     dw_type = "postgresql"
     credentials_class = PostgresCredentials
+    insert_method = staticmethod(insert_with_copy)
+    insert_chunksize = 10_000
 
     def __init__(self):
         super().__init__()
-
-    # ---------------------------
-    # FQTN and namespace methods
-    # ---------------------------
-    def parse_table_and_schema_from_fqtn(
-        self,
-        fqtn: str,
-    ) -> tuple:
-        """
-        Accepts a possible FQTN and returns the schema and table from it
-        """
-        fqtn = self.validate_fqtn(fqtn)
-        return tuple(fqtn.split(".")[1:])
+        # One ADBC connection is kept open for Arrow reads and bulk writes,
+        # so each call skips the connect and auth handshake
+        self._adbc_conn = None
+        self._adbc_lock = threading.Lock()
 
     # ---------------------------
     # Core Data Warehouse methods
@@ -161,8 +209,16 @@ class PostgresDataWarehouse(SQLAlchemyDataWarehouse):
         `credentials`: dict:
             dict (or PostgresCredentials class) holding the connection credentials
         """
+        self._close_adbc()
         super().connect(credentials)
 
+    def close_connection(self):
+        """
+        Close connection
+        """
+        self._close_adbc()
+        super().close_connection()
+
     def create(
         self,
         sql: str,
@@ -188,67 +244,197 @@ class PostgresDataWarehouse(SQLAlchemyDataWarehouse):
         table_type = check_table_type(table_type)
         fqtn = self.magic_fqtn_handler(fqtn, self.default_namespace)
         schema, table = self.parse_table_and_schema_from_fqtn(fqtn=fqtn)
-        if self._table_exists(fqtn=fqtn) and not overwrite:
+        if not overwrite:
+            # A plain CREATE fails with duplicate_table when the name is taken,
+            # so the conflict check rides along with the create itself
+            query = f"CREATE {table_type} {schema}.{table} AS {sql}"
+        elif table_type == "TABLE":
+            # Postgres has no CREATE OR REPLACE TABLE, send the drop and
+            # create together in one round trip instead
+            query = f"DROP TABLE IF EXISTS {schema}.{table}; CREATE TABLE {schema}.{table} AS {sql}"
+        else:
+            query = f"CREATE OR REPLACE {table_type} {schema}.{table} AS {sql}"
+        try:
+            self.execute_query(query, acknowledge_risk=True, response="None")
+        except alchemy_exceptions.DBAPIError as e:
+            if getattr(e.orig, "pgcode", None) != DUPLICATE_TABLE:
+                raise
             msg = (
                 f"A table or view named {fqtn} already exists. "
                 "If you are sure you want to overwrite it, "
                 "pass in overwrite=True and run this function again"
             )
-            raise TableConflictException(msg)
-        query = f"CREATE OR REPLACE {table_type} {schema}.{table} AS {sql}"
-        self.execute_query(query, acknowledge_risk=True, response="None")
+            raise TableConflictException(msg) from e
         return fqtn
 
-    def get_ddl(self, fqtn: str) -> pd.DataFrame:
+    # --------------------------
+    # Postgres specific helpers
+    # --------------------------
+    def _describe_select(self, conn: alchemy_connection, sql: str) -> List[Tuple[str, str]]:
         """
-        Returns a DataFrame describing the column in the table
-        `fqtn`: str:
-            Fully-qualified Table Name (database.schema.table)
+        Describes a SELECT statement without creating a probe view
         """
-        fqtn = self.magic_fqtn_handler(fqtn, self.default_namespace)
-        _, schema_name, table_name = self.parse_fqtn(fqtn)
-        sql = (
-            f"select table_schema, table_name, column_name, data_type, "
-            f"character_maximum_length, column_default, is_nullable from "
-            f"INFORMATION_SCHEMA.COLUMNS where table_name = '{table_name}' "
-            f"and table_schema = '{schema_name}';"
-        )
-        query_response = self.execute_query(sql, response="DF")
-        return query_response
+        return describe_select(conn, sql)
 
-    def get_object_details(self, fqtn: str) -> tuple:
+    def _lookup_table_exists(self, fqtn: str) -> bool:
         """
-        Return details of a table or view in Postgres
-        Params:
-        `fqtn`: str:
-            Fully-qualified table name (database.schema.table)
-        Response:
-            object exists: bool
-            is rasgo object: bool
-            object type: [table|view|unknown]
+        Queries Postgres for the existence of fqtn
+        to_regclass resolves the name in one catalog lookup and returns NULL when it is missing
         """
-        fqtn = self.magic_fqtn_handler(fqtn, self.default_namespace)
-        database, schema, table = self.parse_fqtn(fqtn)
-        sql = (
-            f"SELECT EXISTS(SELECT 1 FROM pg_catalog.pg_class c JOIN "
-            f"pg_catalog.pg_namespace n ON n.oid = c.relnamespace WHERE "
-            f"n.nspname = '{schema}' AND    c.relname = '{table}')"
+        schema, table = self.parse_table_and_schema_from_fqtn(fqtn)
+        result = self.execute_query(
+            TABLE_EXISTS_SQL,
+            acknowledge_risk=True,
+            params={"schema": schema, "table": table},
         )
-        result = self.execute_query(sql, response="dict")
-        obj_exists = len(result) > 0
-        is_rasgo_obj = False
-        obj_type = "unknown"
-        return obj_exists, is_rasgo_obj, obj_type
+        return result[0][0] is not None
+
+    def _object_exists_sql(self, schema: str, table: str) -> Tuple[str, dict]:
+        """
+        Returns the query that finds a Postgres table or view by name
+        """
+        return OBJECT_EXISTS_SQL, {"schema": schema, "table": table}
+
+    def _query_into_df(
+        self,
+        query: str,
+        params: Optional[dict] = None,
+        batches: bool = False,
+    ) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+        """
+        Run a query string and return results in a pandas DataFrame
+        With the ADBC driver installed, queries without bind params are read
+        as Arrow record batches straight off the binary protocol instead of
+        being built up from Python row tuples
+        """
+        if not self._use_adbc(params):
+            return super()._query_into_df(query, params, batches=batches)
+        if batches:
+            return (batch.to_pandas() for batch in self._adbc_record_batches(query))
+        try:
+            with self._adbc_session() as adbc_conn:
+                with adbc_conn.cursor() as cursor:
+                    cursor.execute(query)
+                    return cursor.fetch_df()
+        except Exception as e:
+            self._error_handler(e, query)
+
+    def _query_into_arrow(
+        self,
+        query: str,
+        params: Optional[dict] = None,
+        batches: bool = False,
+    ) -> Union["pa.Table", Iterator["pa.Table"]]:
+        """
+        Run a query string and return results in a pyarrow Table
+        With the ADBC driver installed, the Table is read straight off the
+        binary protocol without a pandas round trip
+        """
+        if not self._use_adbc(params):
+            return super()._query_into_arrow(query, params, batches=batches)
+        if batches:
+            return (pa.Table.from_batches([batch]) for batch in self._adbc_record_batches(query))
+        try:
+            with self._adbc_session() as adbc_conn:
+                with adbc_conn.cursor() as cursor:
+                    cursor.execute(query)
+                    return cursor.fetch_arrow_table()
+        except Exception as e:
+            self._error_handler(e, query)
+
+    def _use_adbc(self, params: Optional[dict] = None) -> bool:
+        """
+        Whether a read can go through ADBC
+        Queries with bind params, and queries inside a _connection() block, stay
+        on the SQLAlchemy connection so they see that transaction's own writes
+        """
+        return adbc_postgres is not None and not params and getattr(self._local, "conn", None) is None
+
+    @contextmanager
+    def _adbc_session(self) -> Iterator["adbc_postgres.Connection"]:
+        """
+        Yields this instance's ADBC connection, opening it on first use
+        If another caller is still using it (e.g. an unfinished batch stream),
+        a short-lived connection is opened instead. Any transaction left open
+        is rolled back on the way out, so idle reads hold no locks
+        """
+        if not self._adbc_lock.acquire(blocking=False):
+            with adbc_postgres.connect(self._url) as adbc_conn:
+                yield adbc_conn
+            return
+        try:
+            if self._adbc_conn is None:
+                self._adbc_conn = adbc_postgres.connect(self._url)
+            try:
+                yield self._adbc_conn
+            finally:
+                try:
+                    self._adbc_conn.rollback()
+                except Exception:
+                    self._close_adbc()
+        finally:
+            self._adbc_lock.release()
+
+    def _close_adbc(self) -> None:
+        """
+        Close the cached ADBC connection, if one is open
+        """
+        adbc_conn, self._adbc_conn = self._adbc_conn, None
+        if adbc_conn is not None:
+            try:
+                adbc_conn.close()
+            except Exception:
+                pass
+
+    def _adbc_record_batches(self, query: str) -> Iterator["pa.RecordBatch"]:
+        """
+        Run a query string through ADBC and yield its Arrow record batches
+        The connection is held until the last batch has been read
+        """
+        try:
+            with self._adbc_session() as adbc_conn:
+                with adbc_conn.cursor() as cursor:
+                    cursor.execute(query)
+                    yield from cursor.fetch_record_batch()
+        except Exception as e:
+            self._error_handler(e, query)
+
+    def _write_df(
+        self,
+        df: pd.DataFrame,
+        conn: alchemy_connection,
+        schema: str,
+        table: str,
+        create_stmt: Optional[str] = None,
+        chunksize: Optional[int] = None,
+    ) -> None:
+        """
+        Inserts DataFrame rows with the ADBC driver when it is installed
+        ADBC streams an Arrow table through binary COPY, so values never become
+        Python objects. Without it, fall back to to_sql with CSV COPY
+        create_stmt runs on the ADBC connection ahead of the COPY, inside the same transaction
+        """
+        if adbc_postgres is None:
+            return super()._write_df(df, conn, schema, table, create_stmt, chunksize)
+        with self._adbc_session() as adbc_conn:
+            with adbc_conn.cursor() as cursor:
+                if create_stmt:
+                    self.clear_object_cache()
+                    cursor.execute(create_stmt)
+                cursor.adbc_ingest(
+                    table,
+                    pa.Table.from_pandas(df, preserve_index=False),
+                    mode="append",
+                    db_schema_name=schema,
+                )
+            adbc_conn.commit()
 
-    # --------------------------
-    # Postgres specific helpers
-    # --------------------------
     @property
-    def _engine(self) -> "alchemy_engine":
+    def _url(self) -> str:
         """
-        Returns a SQLAlchemy engine
+        Returns the connection URL for this Postgres database
         """
-        engine_url = (
+        return (
             f"{self.credentials.get('dw_type')}://"
             f"{self.credentials.get('username')}:"
             f"{urlquote(self.credentials.get('password'))}"
@@ -256,4 +442,10 @@ class PostgresDataWarehouse(SQLAlchemyDataWarehouse):
             f"{self.credentials.get('port')}/"
             f"{self.credentials.get('database')}"
         )
-        return alchemy_engine(engine_url)
+
+    @property
+    def _engine(self) -> "alchemy_engine":
+        """
+        Returns a new SQLAlchemy engine
+        """
+        return alchemy_engine(self._url, **self.pool_options)
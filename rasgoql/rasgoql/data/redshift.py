@@ -2,19 +2,24 @@
 Redshift DataWarehouse classes
 """
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+import io
 import logging
+import math
 import os
-from typing import Optional, Union
+import uuid
+from typing import Iterator, List, Optional, Tuple, Union
 import json
 
 import pandas as pd
 
 from rasgoql.data.base import DWCredentials
+from rasgoql.data.postgres import describe_select
 from rasgoql.data.sqlalchemy import SQLAlchemyDataWarehouse
-from rasgoql.imports import alchemy_engine, alchemy_session, alchemy_url
+from rasgoql.imports import alchemy_connection, alchemy_engine, alchemy_url, boto3, pa
 from rasgoql.utils.creds import load_env, save_env
 from rasgoql.errors import DWCredentialsWarning, TableConflictException
-from rasgoql.primitives.enums import check_table_type
+from rasgoql.primitives.enums import check_response_type, check_table_type
 from rasgoql.utils.messaging import verbose_message
 
 
@@ -22,6 +27,20 @@ logging.basicConfig()
 logger = logging.getLogger("Redshift DataWarehouse")
 logger.setLevel(logging.INFO)
 
+OBJECT_EXISTS_SQL = (
+    "SELECT c.relkind FROM pg_catalog.pg_class c JOIN "
+    "pg_catalog.pg_namespace n ON n.oid = c.relnamespace WHERE "
+    "n.nspname = :schema AND c.relname = :table"
+)
+
+# Threads used to move staged Parquet files to and from S3
+S3_WORKERS = 8
+
+# save_df stages one Parquet file per this many bytes of DataFrame, so COPY
+# can hand the files to separate slices instead of reading one file serially
+COPY_FILE_BYTES = 64 * 1024 * 1024
+COPY_ROW_GROUP_SIZE = 100_000
+
 
 class RedshiftCredentials(DWCredentials):
     """
@@ -29,6 +48,9 @@ class RedshiftCredentials(DWCredentials):
 
     Full list of accepted parameters available at
     https://github.com/aws/amazon-redshift-python-driver#connection-parameters
+
+    Pass `s3_bucket` and `iam_role` to have save_df stage DataFrames in S3
+    and bulk load them with COPY instead of INSERT statements
     """
 
     dw_type = "redshift"
@@ -41,6 +63,8 @@ class RedshiftCredentials(DWCredentials):
         port: Union[str, int],
         database: str,
         schema: str,
+        s3_bucket: Optional[str] = None,
+        iam_role: Optional[str] = None,
         **kwargs,
     ):
         self.username = username
@@ -52,6 +76,8 @@ class RedshiftCredentials(DWCredentials):
             raise DWCredentialsWarning(f"Redshift port number must be an integer") from None
         self.database = database
         self.schema = schema
+        self.s3_bucket = s3_bucket
+        self.iam_role = iam_role
         self.conn_params = kwargs
 
     def __repr__(self) -> str:
@@ -62,6 +88,8 @@ class RedshiftCredentials(DWCredentials):
                 "port": self.port,
                 "database": self.database,
                 "schema": self.schema,
+                "s3_bucket": self.s3_bucket,
+                "iam_role": self.iam_role,
                 "conn_params": self.conn_params,
             }
         )
@@ -81,6 +109,8 @@ class RedshiftCredentials(DWCredentials):
             port = int(env_vars.pop("port"))
             database = env_vars.pop("database")
             schema = env_vars.pop("schema")
+            s3_bucket = env_vars.pop("s3_bucket", None)
+            iam_role = env_vars.pop("iam_role", None)
         except KeyError as key_name:
             raise DWCredentialsWarning(
                 f"Your env file is missing expected credential variable {key_name}. Consider running "
@@ -88,7 +118,7 @@ class RedshiftCredentials(DWCredentials):
             ) from None
         except ValueError:
             raise DWCredentialsWarning(f"Redshift port number must be an integer") from None
-        return cls(username, password, host, port, database, schema, **env_vars)
+        return cls(username, password, host, port, database, schema, s3_bucket, iam_role, **env_vars)
 
     def to_dict(self) -> dict:
         """
@@ -101,6 +131,8 @@ class RedshiftCredentials(DWCredentials):
             "port": self.port,
             "database": self.database,
             "schema": self.schema,
+            "s3_bucket": self.s3_bucket,
+            "iam_role": self.iam_role,
             "dw_type": self.dw_type,
             "conn_params": self.conn_params,
         }
@@ -116,6 +148,11 @@ class RedshiftCredentials(DWCredentials):
             "REDSHIFT_PORT": self.port,
             "REDSHIFT_DATABASE": self.database,
             "REDSHIFT_SCHEMA": self.schema,
+            **{
+                f"REDSHIFT_{key.upper()}": value
+                for key, value in (("s3_bucket", self.s3_bucket), ("iam_role", self.iam_role))
+                if value
+            },
             **{f"REDSHIFT_{key}": str(value) for key, value in self.conn_params.items()},
         }
         return save_env(creds, filepath, overwrite)
@@ -128,11 +165,16 @@ class RedshiftDataWarehouse(SQLAlchemyDataWarehouse):
 
     dw_type = "redshift"
     credentials_class = RedshiftCredentials
+    # Redshift cannot COPY from the client, so send each chunk as one
+    # multi-row INSERT instead of one INSERT per row
+    insert_method = "multi"
+    # Skip the SELECT 1 round trip on every checkout, execute_query retries
+    # reads once when a pooled connection turns out to have been dropped
+    pool_options = {**SQLAlchemyDataWarehouse.pool_options, "pool_pre_ping": False}
 
     def __init__(self):
         super().__init__()
         self.credentials: dict
-        self.connection: alchemy_session
         self.database: Optional[str] = None
         self.schema: Optional[str] = None
 
@@ -162,11 +204,11 @@ class RedshiftDataWarehouse(SQLAlchemyDataWarehouse):
         if isinstance(credentials, RedshiftCredentials):
             credentials = credentials.to_dict()
 
-        try:
-            credentials["conn_params"]["application_name"] = "rasgoql"
-        except KeyError:
-            credentials["conn_params"] = {"application_name": "rasgoql"}
-
+        # Tag the connection on a copy, so the caller's dict is left untouched
+        credentials = {
+            **credentials,
+            "conn_params": {**credentials.get("conn_params", {}), "application_name": "rasgoql"},
+        }
         super().connect(credentials)
 
     def close_connection(self):
@@ -174,9 +216,9 @@ class RedshiftDataWarehouse(SQLAlchemyDataWarehouse):
         Close connection to Redshift
         """
         try:
-            if self.connection:
-                self.connection.close()
-            self.connection = None
+            if self.engine:
+                self.engine.dispose()
+            self.engine = None
             verbose_message("Connection to Redshift closed", logger)
         except Exception as e:
             self._error_handler(e)
@@ -201,17 +243,54 @@ class RedshiftDataWarehouse(SQLAlchemyDataWarehouse):
         table_type = check_table_type(table_type)
         fqtn = self.magic_fqtn_handler(fqtn, self.default_namespace)
         _, schema_name, table_name = self.parse_fqtn(fqtn)
-        if self._table_exists(fqtn) and not overwrite:
-            msg = (
-                f"A table or view named {fqtn} already exists. "
-                "If you are sure you want to overwrite it, "
-                "pass in overwrite=True and run this function again"
-            )
-            raise TableConflictException(msg)
-        query = f"CREATE OR REPLACE {table_type} {schema_name}.{table_name} AS {sql}"
-        self.execute_query(query, acknowledge_risk=True, response="None")
+        with self._connection():
+            if not overwrite and self._table_exists(fqtn):
+                msg = (
+                    f"A table or view named {fqtn} already exists. "
+                    "If you are sure you want to overwrite it, "
+                    "pass in overwrite=True and run this function again"
+                )
+                raise TableConflictException(msg)
+            query = f"CREATE OR REPLACE {table_type} {schema_name}.{table_name} AS {sql}"
+            self.execute_query(query, acknowledge_risk=True, response="None")
         return fqtn
 
+    def execute_query(
+        self,
+        sql: str,
+        response: str = "tuple",
+        acknowledge_risk: bool = False,
+        params: Optional[dict] = None,
+        batches: bool = False,
+        via_s3: bool = False,
+        **kwargs,
+    ):
+        """
+        Run a query against Redshift and return all results
+        Accepts every argument of SQLAlchemyDataWarehouse.execute_query, plus:
+        `via_s3`: bool:
+            when response is df, UNLOAD the results to the credentials' S3 bucket
+            and read them back from there instead of through the leader node.
+            With batches, yields one DataFrame per unloaded Parquet file.
+            Use this for large SELECTs without params; requires s3_bucket, iam_role and boto3
+        """
+        if params or not (via_s3 and self._s3_settings() and check_response_type(response) == "DF"):
+            return super().execute_query(sql, response, acknowledge_risk, params, batches, **kwargs)
+        if batches:
+            return self._unload_batches(sql, acknowledge_risk)
+        bucket, iam_role = self._s3_settings()
+        s3 = boto3.client("s3")
+        keys = []
+        try:
+            self._unload(s3, bucket, iam_role, sql, acknowledge_risk, keys)
+            with ThreadPoolExecutor(max_workers=S3_WORKERS) as pool:
+                frames = list(pool.map(lambda key: self._read_s3_parquet(s3, bucket, key), keys))
+        finally:
+            self._delete_s3_keys(s3, bucket, keys)
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, ignore_index=True)
+
     @property
     def default_namespace(self) -> str:
         """
@@ -229,40 +308,141 @@ class RedshiftDataWarehouse(SQLAlchemyDataWarehouse):
         self.database = db
         self.schema = schema
 
-    def get_ddl(self, fqtn: str) -> pd.DataFrame:
-        return super().get_ddl(fqtn)
+    # --------------------------
+    # Redshift specific helpers
+    # --------------------------
+    def _describe_select(self, conn: alchemy_connection, sql: str) -> List[Tuple[str, str]]:
+        """
+        Describes a SELECT statement without creating a probe view
+        """
+        return describe_select(conn, sql)
 
-    def get_object_details(self, fqtn: str) -> tuple:
+    def _object_exists_sql(self, schema: str, table: str) -> Tuple[str, dict]:
         """
-        Return details of a table or view in Redshift
-        Params:
-        `fqtn`: str:
-            Fully-qualified table name (database.schema.table)
-        Response:
-            object exists: bool
-            is rasgo object: bool
-            object type: [table|view|unknown]
+        Returns the query that finds a Redshift table or view by name
         """
-        fqtn = self.magic_fqtn_handler(fqtn, self.default_namespace)
-        database, schema, table = self.parse_fqtn(fqtn)
-        sql = (
-            f"SELECT EXISTS(SELECT 1 FROM pg_catalog.pg_class c JOIN "
-            f"pg_catalog.pg_namespace n ON n.oid = c.relnamespace WHERE "
-            f"n.nspname = '{schema}' AND c.relname = '{table}')"
+        return OBJECT_EXISTS_SQL, {"schema": schema, "table": table}
+
+    def _s3_settings(self) -> Optional[Tuple[str, str]]:
+        """
+        Returns the S3 bucket and IAM role used for COPY and UNLOAD, or None
+        when they are not configured or boto3 and pyarrow are not installed
+        """
+        bucket = self.credentials.get("s3_bucket")
+        iam_role = self.credentials.get("iam_role")
+        if not (bucket and iam_role) or boto3 is None or pa is None:
+            return None
+        return bucket, iam_role
+
+    def _unload(self, s3, bucket: str, iam_role: str, sql: str, acknowledge_risk: bool, keys: List[str]) -> None:
+        """
+        UNLOADs the results of sql to the S3 bucket as Parquet and adds the written keys to keys
+        """
+        prefix = f"rasgoql/unload/{uuid.uuid4().hex}/"
+        query = sql.strip().rstrip(";").replace("'", "''")
+        unload = f"UNLOAD ('{query}') TO 's3://{bucket}/{prefix}' IAM_ROLE '{iam_role}' FORMAT AS PARQUET PARALLEL ON"
+        super().execute_query(unload, "None", acknowledge_risk)
+        for page in s3.get_paginator("list_objects_v2").paginate(Bucket=bucket, Prefix=prefix):
+            keys.extend(item["Key"] for item in page.get("Contents", []))
+
+    def _unload_batches(self, sql: str, acknowledge_risk: bool) -> Iterator[pd.DataFrame]:
+        """
+        UNLOADs the results of sql to S3 and yields one DataFrame per Parquet file,
+        downloading each only when it is asked for
+        The unloaded files are deleted once the last batch has been read
+        """
+        bucket, iam_role = self._s3_settings()
+        s3 = boto3.client("s3")
+        keys = []
+        try:
+            self._unload(s3, bucket, iam_role, sql, acknowledge_risk, keys)
+            for key in keys:
+                yield self._read_s3_parquet(s3, bucket, key)
+        finally:
+            self._delete_s3_keys(s3, bucket, keys)
+
+    @staticmethod
+    def _delete_s3_keys(s3, bucket: str, keys: List[str]) -> None:
+        """
+        Deletes staged S3 objects, up to the 1000 keys allowed per request at a time
+        """
+        for start in range(0, len(keys), 1000):
+            s3.delete_objects(
+                Bucket=bucket,
+                Delete={"Objects": [{"Key": key} for key in keys[start : start + 1000]]},
+            )
+
+    @staticmethod
+    def _upload_parquet(s3, bucket: str, key: str, df: pd.DataFrame) -> None:
+        """
+        Writes a DataFrame to S3 as one Snappy Parquet file
+        """
+        buffer = io.BytesIO()
+        df.to_parquet(
+            buffer,
+            index=False,
+            compression="snappy",
+            row_group_size=COPY_ROW_GROUP_SIZE,
         )
-        result = self.execute_query(sql, response="dict")
-        obj_exists = len(result) > 0
-        is_rasgo_obj = False
-        obj_type = "unknown"
-        return obj_exists, is_rasgo_obj, obj_type
+        s3.put_object(Bucket=bucket, Key=key, Body=buffer.getvalue())
+
+    @staticmethod
+    def _read_s3_parquet(s3, bucket: str, key: str) -> pd.DataFrame:
+        """
+        Downloads one Parquet file from S3 into a DataFrame
+        """
+        body = s3.get_object(Bucket=bucket, Key=key)["Body"].read()
+        return pd.read_parquet(io.BytesIO(body))
+
+    def _write_df(
+        self,
+        df: pd.DataFrame,
+        conn: alchemy_connection,
+        schema: str,
+        table: str,
+        create_stmt: Optional[str] = None,
+        chunksize: Optional[int] = None,
+    ) -> None:
+        """
+        Loads DataFrame rows through S3 when the credentials name a bucket and IAM role
+        The DataFrame is staged as Snappy Parquet files of about COPY_FILE_BYTES each and
+        read with a single COPY of their prefix, which Redshift splits across its slices.
+        Files upload in parallel while the CREATE runs, and COPY waits for all of them.
+        Without S3 settings, fall back to INSERTs
+        """
+        if not self._s3_settings():
+            return super()._write_df(df, conn, schema, table, create_stmt, chunksize)
+        bucket, iam_role = self._s3_settings()
+        prefix = f"rasgoql/copy/{uuid.uuid4().hex}/"
+        files = max(1, math.ceil(df.memory_usage(index=False, deep=True).sum() / COPY_FILE_BYTES))
+        rows_per_file = max(1, math.ceil(len(df) / files))
+        s3 = boto3.client("s3")
+        starts = range(0, max(len(df), 1), rows_per_file)
+        keys = [f"{prefix}part-{number:05d}.parquet" for number in range(len(starts))]
+        try:
+            # Leaving the pool waits for every upload, so cleanup never races one
+            with ThreadPoolExecutor(max_workers=S3_WORKERS) as pool:
+                uploads = [
+                    pool.submit(self._upload_parquet, s3, bucket, key, df.iloc[start : start + rows_per_file])
+                    for key, start in zip(keys, starts)
+                ]
+                with conn.begin():
+                    if create_stmt:
+                        self.clear_object_cache()
+                        conn.exec_driver_sql(create_stmt)
+                    for upload in uploads:
+                        upload.result()
+                    conn.exec_driver_sql(
+                        f"COPY {schema}.{table} FROM 's3://{bucket}/{prefix}' "
+                        f"IAM_ROLE '{iam_role}' FORMAT AS PARQUET"
+                    )
+        finally:
+            self._delete_s3_keys(s3, bucket, keys)
 
-    # --------------------------
-    # Redshift specific helpers
-    # --------------------------
     @property
     def _engine(self) -> alchemy_engine:
         """
-        Returns a SQLAlchemy engine
+        Returns a new SQLAlchemy engine
         """
         url = alchemy_url.create(
             drivername="redshift+redshift_connector",
@@ -275,4 +455,5 @@ class RedshiftDataWarehouse(SQLAlchemyDataWarehouse):
         return alchemy_engine(
             url,
             connect_args=self.credentials.get("conn_params", {}),
+            **self.pool_options,
         )
@@ -2,14 +2,22 @@
 Snowflake DataWarehouse classes
 """
 from __future__ import annotations
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import io
 import logging
+from operator import itemgetter
 import os
-from typing import List, Optional, Tuple, Union
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+import uuid
 
 import json
 import pandas as pd
 
-from rasgoql.data.base import DataWarehouse, DWCredentials
+from rasgoql.data.base import READ_ONLY_PREFIXES, DataWarehouse, DWCredentials
 from rasgoql.errors import (
     DWCredentialsWarning,
     DWConnectionError,
@@ -20,7 +28,7 @@ from rasgoql.errors import (
     TableAccessError,
     TableConflictException,
 )
-from rasgoql.imports import sf_connector, write_pandas
+from rasgoql.imports import pa, sf_connector
 from rasgoql.primitives.enums import check_response_type, check_write_method, check_write_table_type
 from rasgoql.utils.creds import load_env, save_env
 from rasgoql.utils.df import cleanse_sql_dataframe, generate_dataframe_ddl
@@ -31,6 +39,34 @@ logging.basicConfig()
 logger = logging.getLogger('Snowflake DataWarehouse')
 logger.setLevel(logging.INFO)
 
+# Pulls the (name, type) pair out of a column description row in one call
+name_and_type = itemgetter('name', 'type')
+
+# Error codes Snowflake raises when an object does not exist or is not
+# authorized, and when creating an object whose name is taken
+OBJECT_DOES_NOT_EXIST = 2003
+OBJECT_ALREADY_EXISTS = 2002
+
+# Most namespaces list_tables_multi queries at once
+LIST_TABLES_WORKERS = 8
+
+# Statements whose results the opt-in result cache may reuse. SHOW is left
+# out, since list_tables and other metadata must see creates and drops
+RESULT_CACHE_PREFIXES = ('select', 'with', 'desc')
+
+# Seconds wait() sleeps between status checks, doubling up to the max
+POLL_INTERVAL = 0.1
+MAX_POLL_INTERVAL = 5.0
+
+LIST_TABLES_SQL = (
+    "SELECT TABLE_NAME, "
+    "TABLE_CATALOG||'.'||TABLE_SCHEMA||'.'||TABLE_NAME AS FQTN, "
+    "CASE TABLE_TYPE WHEN 'BASE TABLE' THEN 'TABLE' ELSE TABLE_TYPE END AS TABLE_TYPE, "
+    "ROW_COUNT, CREATED, LAST_ALTERED "
+    "FROM {catalog}INFORMATION_SCHEMA.TABLES"
+)
+LIST_TABLES_IN_SCHEMA_SQL = LIST_TABLES_SQL + " WHERE TABLE_SCHEMA = %(schema)s"
+
 
 class SnowflakeCredentials(DWCredentials):
     """
@@ -147,6 +183,16 @@ class SnowflakeDataWarehouse(DataWarehouse):
 
     dw_type = 'snowflake'
     credentials_class = SnowflakeCredentials
+    # save_df writes rows to Parquet files of insert_chunksize rows, then
+    # one PUT uploads upload_parallel of them at a time before the COPY
+    insert_chunksize: int = 100_000
+    upload_parallel: int = 8
+    # The vectorized Parquet scanner loads faster, turn it off for accounts that lack it
+    use_vectorized_scanner: bool = True
+    # Seconds execute_query reuses the results of a read-only query, 0 turns this off
+    # Any statement that may change data clears them
+    result_cache_ttl: float = 0
+    result_cache_size: int = 128
 
     def __init__(self):
         super().__init__()
@@ -154,6 +200,9 @@ class SnowflakeDataWarehouse(DataWarehouse):
         self.connection: sf_connector.SnowflakeConnection = None
         self.default_database = None
         self.default_schema = None
+        # fqtn -> (query id, table_type) of creates submitted by create_async
+        self._pending: Dict[str, Tuple[str, str]] = {}
+        self._result_cache: OrderedDict[tuple, Tuple[float, Any]] = OrderedDict()
 
     # ---------------------------
     # Core Data Warehouse methods
@@ -170,26 +219,36 @@ class SnowflakeDataWarehouse(DataWarehouse):
             namespace (database.schema)
         """
         namespace = self.validate_namespace(namespace)
+        if namespace.upper() == self.default_namespace.upper():
+            return
         database, schema = self.parse_namespace(namespace)
         try:
-            self.execute_query(f'USE DATABASE {database}')
-            self.execute_query(f'USE SCHEMA {schema}')
+            # A qualified USE SCHEMA switches the database in the same statement
+            self.execute_query(f'USE SCHEMA {database}.{schema}')
             self.default_namespace = namespace
-            self.default_database = database
-            self.default_schema = schema
             verbose_message(
-                f"Namespace reset to {self.default_namespace}",
+                "Namespace reset to %s",
                 logger,
+                self.default_namespace,
             )
         except Exception as e:
             self._error_handler(e)
 
+    def clear_object_cache(self) -> None:
+        """
+        Forget all cached table lookups and query results
+        Call this after tables are created, dropped, or loaded outside of this connection
+        """
+        super().clear_object_cache()
+        self._result_cache.clear()
+
     def connect(
         self,
         credentials: Union[dict, SnowflakeCredentials],
     ):
         """
         Connect to Snowflake
+        Reconnecting with the same credentials reuses the open session
 
         Params:
         `credentials`: dict:
@@ -199,13 +258,21 @@ class SnowflakeDataWarehouse(DataWarehouse):
             credentials = credentials.to_dict()
 
         # This allows you to track what queries were run by RasgoQL in your history tab
-        credentials.update(
-            {
-                "application": "rasgoql",
-                "session_parameters": {"QUERY_TAG": "rasgoql"},
-            }
-        )
+        # Tag a copy, so the caller's dict is left untouched
+        credentials = {
+            **credentials,
+            "application": "rasgoql",
+            "session_parameters": {"QUERY_TAG": "rasgoql"},
+        }
+        if credentials == self.credentials and self.connection and not self.connection.is_closed():
+            # Skip authenticating again, only return to the credentials' namespace
+            self.change_namespace(f"{credentials.get('database')}.{credentials.get('schema')}")
+            return
         try:
+            self.clear_object_cache()
+            # Release the old session rather than leave it open behind the new one
+            if self.connection:
+                self.connection.close()
             self.credentials = credentials
             self.default_database = credentials.get('database')
             self.default_schema = credentials.get('schema')
@@ -255,19 +322,156 @@ class SnowflakeDataWarehouse(DataWarehouse):
             and you know you want to overwrite it
             WARNING: This will completely overwrite data in the existing table
         """
-        table_type = check_write_table_type(table_type)
-        fqtn = self.magic_fqtn_handler(fqtn, self.default_namespace)
-        if self._table_exists(fqtn) and not overwrite:
-            msg = (
-                f'A table or view named {fqtn} already exists. '
-                'If you are sure you want to overwrite it, '
-                'pass in overwrite=True and run this function again'
-            )
-            raise TableConflictException(msg)
-        query = f"CREATE OR REPLACE {table_type} {fqtn} COMMENT='rasgoql' AS {sql}"
-        self.execute_query(query, acknowledge_risk=True, response='None')
+        fqtn, table_type, query = self._create_statement(sql, fqtn, table_type, overwrite)
+        try:
+            self.execute_query(query, acknowledge_risk=True, response='None')
+        except sf_connector.errors.ProgrammingError as e:
+            if e.errno != OBJECT_ALREADY_EXISTS:
+                raise
+            raise self._table_conflict(fqtn) from e
+        # The create cleared the cache, but the new object's details are already known
+        self._remember_object(fqtn, (True, True, table_type))
         return fqtn
 
+    def create_batch(
+        self,
+        items: List[Tuple[str, str, str]],
+        overwrite: bool = False,
+    ) -> List[str]:
+        """
+        Create several views or tables from given SQL in a single submission
+        Statements run in order, so later items may select from earlier ones
+
+        Params:
+        `items`: list:
+            (sql, fqtn, table_type) of each object to create
+        `overwrite`: bool
+            pass True when these table names already exist in your DataWarehouse
+            and you know you want to overwrite them
+            WARNING: This will completely overwrite data in the existing tables
+        """
+        fqtns = [self.magic_fqtn_handler(fqtn, self.default_namespace) for _, fqtn, _ in items]
+        if not overwrite:
+            conflicts = self._existing_objects(fqtns)
+            if conflicts:
+                msg = (
+                    f'Tables or views named {", ".join(conflicts)} already exist. '
+                    'If you are sure you want to overwrite them, '
+                    'pass in overwrite=True and run this function again'
+                )
+                raise TableConflictException(msg)
+        statements = [
+            self._create_statement(sql, fqtn, table_type, overwrite) for (sql, _, table_type), fqtn in zip(items, fqtns)
+        ]
+        if not statements:
+            return []
+        query = ';\n'.join(query for _, _, query in statements)
+        verbose_message(
+            "Executing query: %s",
+            logger,
+            query,
+        )
+        try:
+            self.clear_object_cache()
+            with self.connection.cursor() as cursor:
+                cursor.execute(query, num_statements=len(statements))
+        except Exception as e:
+            self._error_handler(e, query)
+        for fqtn, table_type, _ in statements:
+            self._remember_object(fqtn, (True, True, table_type))
+        return fqtns
+
+    def create_async(
+        self,
+        sql: str,
+        fqtn: str,
+        table_type: str = 'VIEW',
+        overwrite: bool = False,
+    ) -> str:
+        """
+        Submit the create of a view or table from given SQL without waiting for it
+        Independent creates can be submitted back to back, then awaited with `wait`
+
+        Params:
+        `sql`: str:
+            query that returns data (i.e. can be wrapped in a CREATE TABLE statement)
+        `fqtn`: str:
+            Fully-qualified table name (database.schema.table)
+            Name for the new table
+        `table_type`: str:
+            One of values: [view, table]
+        `overwrite`: bool
+            pass True when this table name already exists in your DataWarehouse
+            and you know you want to overwrite it
+            WARNING: This will completely overwrite data in the existing table
+        """
+        fqtn, table_type, query = self._create_statement(sql, fqtn, table_type, overwrite)
+        try:
+            self.clear_object_cache()
+            with self.connection.cursor() as cursor:
+                cursor.execute_async(query)
+                self._pending[fqtn] = (cursor.sfqid, table_type)
+        except Exception as e:
+            self._error_handler(e, query)
+        return fqtn
+
+    def wait(
+        self,
+        fqtn: str = None,
+    ) -> None:
+        """
+        Block until creates submitted by `create_async` finish
+        Every create is awaited even if one fails, then the first failure is raised
+
+        Params:
+        `fqtn`: str:
+            Fully-qualified table name (database.schema.table) to wait for,
+            waits for every pending create when omitted
+        """
+        if fqtn:
+            fqtn = self.magic_fqtn_handler(fqtn, self.default_namespace)
+            if fqtn not in self._pending:
+                raise ParameterException(
+                    f'No create is pending for {fqtn}. Submit it with create_async before waiting on it'
+                )
+            fqtns = [fqtn]
+        else:
+            fqtns = list(self._pending)
+        errors = []
+        for name in fqtns:
+            try:
+                self._await_create(name)
+            except Exception as e:
+                errors.append(e)
+        for e in errors[1:]:
+            logger.warning('Async create also failed: %s', e)
+        if errors:
+            raise errors[0]
+
+    def _await_create(
+        self,
+        fqtn: str,
+    ) -> None:
+        """
+        Poll one create submitted by `create_async` until it finishes
+        The handle is dropped from the pending list whether or not the create succeeded
+        """
+        sfqid, table_type = self._pending[fqtn]
+        interval = POLL_INTERVAL
+        try:
+            while self.connection.is_still_running(self.connection.get_query_status_throw_if_error(sfqid)):
+                time.sleep(interval)
+                interval = min(interval * 2, MAX_POLL_INTERVAL)
+        except sf_connector.errors.ProgrammingError as e:
+            if e.errno == OBJECT_ALREADY_EXISTS:
+                raise self._table_conflict(fqtn) from e
+            self._error_handler(e)
+        except Exception as e:
+            self._error_handler(e)
+        finally:
+            self._pending.pop(fqtn, None)
+        self._remember_object(fqtn, (True, True, table_type))
+
     @property
     def default_namespace(self) -> str:
         """
@@ -294,6 +498,8 @@ class SnowflakeDataWarehouse(DataWarehouse):
         response: str = 'tuple',
         acknowledge_risk: bool = False,
         batches: bool = False,
+        params: Optional[dict] = None,
+        bypass_cache: bool = False,
     ):
         """
         Run a query against Snowflake and return all results
@@ -301,14 +507,23 @@ class SnowflakeDataWarehouse(DataWarehouse):
         `sql`: str:
             query text to execute
         `response`: str:
-            Possible values: [dict, df, None]
+            Possible values: [arrow, dict, df, None]
         `acknowledge_risk`: bool:
             pass True when you know your SQL statement contains
             a potentially dangerous or data-altering operation
             and still want to run it against your DataWarehouse
+        `batches`: bool:
+            when response is df or arrow, return an iterator of
+            DataFrames or Arrow tables instead of a single one.
+            When response is dict or tuple, return an iterator of rows instead of a list
+        `params`: dict:
+            values to bind to %(name)s parameters in the query text
+        `bypass_cache`: bool:
+            pass True to run the query even when result_cache_ttl
+            holds a recent result for it
         """
         response = check_response_type(response)
-        if is_scary_sql(sql) and not acknowledge_risk:
+        if not acknowledge_risk and is_scary_sql(sql):
             msg = (
                 'It looks like your SQL statement contains a '
                 'potentially dangerous or data-altering operation.'
@@ -317,14 +532,25 @@ class SnowflakeDataWarehouse(DataWarehouse):
             )
             raise SQLWarning(msg)
         verbose_message(
-            f"Executing query: {sql}",
+            "Executing query: %s",
             logger,
+            sql,
         )
-        if response == 'DICT':
-            return self._execute_dict_cursor(sql)
-        if response == 'DF':
-            return self._execute_df_cursor(sql, batches=batches)
-        return self._execute_string(sql, ignore_results=(response == 'NONE'))
+        read_only = sql.lstrip().lower().startswith(READ_ONLY_PREFIXES)
+        if not read_only:
+            self.clear_object_cache()
+        cacheable = sql.lstrip().lower().startswith(RESULT_CACHE_PREFIXES)
+        if cacheable and self.result_cache_ttl and not batches and response != 'NONE' and not bypass_cache:
+            key = (
+                sql,
+                tuple(sorted(params.items())) if params else None,
+                response,
+                (self.credentials or {}).get('role'),
+                self.default_database,
+                self.default_schema,
+            )
+            return self._cached_result(key, lambda: self._run_query(sql, response, params))
+        return self._run_query(sql, response, params, batches)
 
     def get_ddl(
         self,
@@ -337,8 +563,8 @@ class SnowflakeDataWarehouse(DataWarehouse):
             Fully-qualified Table Name (database.schema.table)
         """
         fqtn = self.magic_fqtn_handler(fqtn, self.default_namespace)
-        sql = f"SELECT GET_DDL('TABLE', '{fqtn}') AS DDL"
-        query_response = self.execute_query(sql, response='dict')
+        sql = "SELECT GET_DDL('TABLE', %(fqtn)s) AS DDL"
+        query_response = self.execute_query(sql, acknowledge_risk=True, response='dict', params={'fqtn': fqtn})
         return query_response[0]['DDL']
 
     def get_object_details(
@@ -358,16 +584,7 @@ class SnowflakeDataWarehouse(DataWarehouse):
             object type: [table|view|unknown]
         """
         fqtn = self.magic_fqtn_handler(fqtn, self.default_namespace)
-        database, schema, table = self.parse_fqtn(fqtn)
-        sql = f"SHOW OBJECTS LIKE '{table}' IN {database}.{schema}"
-        result = self.execute_query(sql, response='dict')
-        obj_exists = len(result) > 0
-        is_rasgo_obj = False
-        obj_type = 'unknown'
-        if obj_exists:
-            is_rasgo_obj = result[0].get('comment') == 'rasgoql'
-            obj_type = result[0].get('kind')
-        return obj_exists, is_rasgo_obj, obj_type
+        return self._cached_lookup(fqtn, self._object_details, exists=lambda details: details[0])
 
     def get_schema(
         self,
@@ -383,15 +600,20 @@ class SnowflakeDataWarehouse(DataWarehouse):
         """
         # Check for SQL
         if self._is_select_statement(fqtn_or_sql):
-            query_response = self.connection.cursor().describe(fqtn_or_sql)
+            # describe compiles the query for its result metadata without running it
+            with self.connection.cursor() as cursor:
+                query_response = cursor.describe(fqtn_or_sql)
             return [(row[0], convert_to_type(row[1], row[4], row[5])) for row in query_response]
         # Otherwise assume fqtn:
+        # DESC fails on a missing table, so it doubles as the existence check
         fqtn = self.magic_fqtn_handler(fqtn_or_sql, self.default_namespace)
-        if self._table_exists(fqtn):
-            query_response = self.execute_query(f"DESC TABLE {fqtn}", response='dict')
-            return [(row['name'], row['type']) for row in query_response]
-        else:
-            raise TableAccessError(f'Table {fqtn} does not exist or cannot be accessed.')
+        try:
+            query_response = self.execute_query(f"DESC TABLE {fqtn}", acknowledge_risk=True, response='dict')
+        except sf_connector.errors.ProgrammingError as e:
+            if e.errno != OBJECT_DOES_NOT_EXIST:
+                raise
+            raise TableAccessError(f'Table {fqtn} does not exist or cannot be accessed.') from e
+        return list(map(name_and_type, query_response))
 
     def list_tables(
         self,
@@ -407,18 +629,30 @@ class SnowflakeDataWarehouse(DataWarehouse):
         `schema`: str:
             override schema
         """
-        select_clause = (
-            "SELECT TABLE_NAME, "
-            "TABLE_CATALOG||'.'||TABLE_SCHEMA||'.'||TABLE_NAME AS FQTN, "
-            "CASE TABLE_TYPE WHEN 'BASE TABLE' THEN 'TABLE' ELSE TABLE_TYPE END AS TABLE_TYPE, "
-            "ROW_COUNT, CREATED, LAST_ALTERED "
-        )
-        from_clause = " FROM INFORMATION_SCHEMA.TABLES "
-        if database:
-            from_clause = f" FROM {database.upper()}.INFORMATION_SCHEMA.TABLES "
-        where_clause = f" WHERE TABLE_SCHEMA = '{schema.upper()}'" if schema else ""
-        sql = select_clause + from_clause + where_clause
-        return self.execute_query(sql, response='df', acknowledge_risk=True)
+        sql = LIST_TABLES_IN_SCHEMA_SQL if schema else LIST_TABLES_SQL
+        sql = sql.format(catalog=f"{database.upper()}." if database else "")
+        params = {'schema': schema.upper()} if schema else None
+        return self.execute_query(sql, response='df', acknowledge_risk=True, params=params)
+
+    def list_tables_multi(
+        self,
+        namespaces: List[str],
+    ) -> pd.DataFrame:
+        """
+        List all tables and views available in several namespaces
+        Each namespace is queried on its own thread and cursor, so the
+        round trips overlap instead of running one after another
+
+        Params:
+        `namespaces`: list:
+            namespaces (database.schema) to list
+        """
+        namespaces = [self.parse_namespace(namespace) for namespace in namespaces]
+        if not namespaces:
+            return pd.DataFrame()
+        with ThreadPoolExecutor(max_workers=min(LIST_TABLES_WORKERS, len(namespaces))) as pool:
+            frames = list(pool.map(lambda namespace: self.list_tables(*namespace), namespaces))
+        return pd.concat(frames, ignore_index=True)
 
     def preview(
         self,
@@ -434,17 +668,60 @@ class SnowflakeDataWarehouse(DataWarehouse):
         `limit`: int:
             Records to return
         """
+        # Wrap rather than append so queries that already end in a semicolon or
+        # carry their own LIMIT still work. The wrapped text is the same each time
+        # a query is previewed, so Snowflake can answer repeats from its result cache
+        # The limit is inlined rather than bound: binding makes the connector apply
+        # pyformat substitution to the whole query and break literal % characters
+        query = f"SELECT * FROM ({sql.strip().rstrip(';')}) AS rql_preview LIMIT {int(limit)}"
         return self.execute_query(
-            f'{sql} LIMIT {limit}',
+            query,
             response='df',
             acknowledge_risk=True,
         )
 
+    def preview_many(
+        self,
+        sqls: List[str],
+        limit: int = 10,
+    ) -> List[pd.DataFrame]:
+        """
+        Returns the first records of several SQL statements, one DataFrame each
+        All previews are sent as one multi-statement request
+
+        Params:
+        `sqls`: list:
+            SQL statments to run
+        `limit`: int:
+            Records to return for each statement
+        """
+        if not sqls:
+            return []
+        query = ';\n'.join(
+            f"SELECT * FROM ({sql.strip().rstrip(';')}) AS rql_preview LIMIT {int(limit)}" for sql in sqls
+        )
+        verbose_message(
+            "Executing query: %s",
+            logger,
+            query,
+        )
+        previews = []
+        try:
+            with self.connection.cursor() as cursor:
+                cursor.execute(query, num_statements=len(sqls))
+                previews.append(cursor.fetch_pandas_all())
+                while cursor.nextset():
+                    previews.append(cursor.fetch_pandas_all())
+        except Exception as e:
+            self._error_handler(e, query)
+        return previews
+
     def save_df(
         self,
         df: pd.DataFrame,
         fqtn: str,
         method: str = None,
+        chunksize: int = None,
     ) -> str:
         """
         Creates a table in Snowflake from a pandas Dataframe
@@ -452,6 +729,7 @@ class SnowflakeDataWarehouse(DataWarehouse):
         Params:
         `df`: pandas DataFrame:
             DataFrame to upload
+            its column names are made SQL compliant in place, without a copy
         `fqtn`: str:
             Fully-qualied table name (database.schema.table)
             Name for the new table
@@ -461,6 +739,8 @@ class SnowflakeDataWarehouse(DataWarehouse):
             pass append: to add dataframe rows to it
             pass replace: to overwrite it with dataframe rows
                 WARNING: This will completely overwrite data in the existing table
+        `chunksize`: int
+            rows staged per Parquet file, defaults to insert_chunksize
         """
         if method:
             method = check_write_method(method)
@@ -481,12 +761,8 @@ class SnowflakeDataWarehouse(DataWarehouse):
                 create_stmt = generate_dataframe_ddl(df, fqtn)
                 create_stmt += " COMMENT='rasgoql' "
                 self.execute_query(create_stmt, response='None', acknowledge_risk=True)
-            _success, _chunks, _rows, _output = write_pandas(
-                conn=self.connection,
-                df=df,
-                table_name=fqtn,
-                quote_identifiers=False,
-            )
+                self._remember_object(fqtn, (True, True, 'TABLE'))
+            self._stage_and_copy(df, fqtn, chunksize or self.insert_chunksize)
             return fqtn
         except Exception as e:
             self._error_handler(e)
@@ -494,19 +770,90 @@ class SnowflakeDataWarehouse(DataWarehouse):
     # ---------------------------
     # Core Data Warehouse helpers
     # ---------------------------
+    def _create_statement(
+        self,
+        sql: str,
+        fqtn: str,
+        table_type: str,
+        overwrite: bool,
+    ) -> Tuple[str, str, str]:
+        """
+        Returns the resolved fqtn, table type, and CREATE statement for `create`
+        Without overwrite, a plain CREATE fails when the name is taken, so the
+        conflict check rides along with the create itself
+        """
+        table_type = check_write_table_type(table_type)
+        fqtn = self.magic_fqtn_handler(fqtn, self.default_namespace)
+        create = 'CREATE OR REPLACE' if overwrite else 'CREATE'
+        return fqtn, table_type, f"{create} {table_type} {fqtn} COMMENT='rasgoql' AS {sql}"
+
+    @staticmethod
+    def _table_conflict(
+        fqtn: str,
+    ) -> TableConflictException:
+        """
+        Returns the error raised when creating an object whose name is taken
+        """
+        return TableConflictException(
+            f'A table or view named {fqtn} already exists. '
+            'If you are sure you want to overwrite it, '
+            'pass in overwrite=True and run this function again'
+        )
+
+    def _existing_objects(
+        self,
+        fqtns: List[str],
+    ) -> List[str]:
+        """
+        Returns the fqtns that already exist, listing each schema once
+        instead of looking up every name on its own
+        """
+        names_by_schema = {}
+        for fqtn in fqtns:
+            database, schema, table = self.parse_fqtn(fqtn)
+            names_by_schema.setdefault(f'{database}.{schema}', set()).add(table.upper())
+        existing = set()
+        for namespace, names in names_by_schema.items():
+            result = self.execute_query(f"SHOW OBJECTS IN {namespace}", acknowledge_risk=True, response='dict')
+            existing.update(f"{namespace}.{row['name']}".upper() for row in result if row['name'].upper() in names)
+        return [fqtn for fqtn in fqtns if fqtn.upper() in existing]
+
+    def _object_details(
+        self,
+        fqtn: str,
+    ) -> tuple:
+        """
+        Look up a table or view by an fqtn already resolved by magic_fqtn_handler
+        """
+        database, schema, table = self.parse_fqtn(fqtn)
+        # SHOW cannot take identifiers as binds, but the LIKE pattern can be bound
+        sql = f"SHOW OBJECTS LIKE %(table)s IN {database}.{schema}"
+        result = self.execute_query(sql, acknowledge_risk=True, response='dict', params={'table': table})
+        # LIKE treats _ as a wildcard, so keep only the exact name
+        result = [row for row in result if row.get('name', '').upper() == table.upper()]
+        obj_exists = len(result) > 0
+        is_rasgo_obj = False
+        obj_type = 'unknown'
+        if obj_exists:
+            is_rasgo_obj = result[0].get('comment') == 'rasgoql'
+            obj_type = result[0].get('kind')
+        return obj_exists, is_rasgo_obj, obj_type
+
     def _table_exists(
         self,
         fqtn: str,
     ) -> bool:
         """
         Check for existence of fqtn in the Data Warehouse and return a boolean
+        Answers are reused for object_cache_ttl seconds, and any statement
+        run through execute_query that may change tables clears them
 
         Params:
         `fqtn`: str:
-            Fully-qualified table name (database.schema.table)
+            Fully-qualified table name (database.schema.table), already
+            resolved by the calling method's magic_fqtn_handler
         """
-        fqtn = self.magic_fqtn_handler(fqtn, self.default_namespace)
-        do_i_exist, _, _ = self.get_object_details(fqtn)
+        do_i_exist, _, _ = self._cached_lookup(fqtn, self._object_details, exists=lambda details: details[0])
         return do_i_exist
 
     # --------------------------
@@ -521,8 +868,9 @@ class SnowflakeDataWarehouse(DataWarehouse):
         Handle Snowflake exceptions that need additional info
         """
         verbose_message(
-            f"Exception occurred while running query: {query}",
+            "Exception occurred while running query: %s",
             logger,
+            query,
         )
         if exception is None:
             return
@@ -550,9 +898,60 @@ class SnowflakeDataWarehouse(DataWarehouse):
             ) from exception
         raise exception
 
+    def _run_query(
+        self,
+        sql: str,
+        response: str,
+        params: Optional[dict] = None,
+        batches: bool = False,
+    ):
+        """
+        Sends a query to the executor matching a checked response type
+        """
+        if response == 'DICT':
+            if batches:
+                return self._execute_dict_rows(sql, params)
+            return self._execute_dict_cursor(sql, params)
+        if response == 'DF':
+            return self._execute_df_cursor(sql, params, batches=batches)
+        if response == 'ARROW':
+            return self._execute_arrow_cursor(sql, params, batches=batches)
+        if response == 'TUPLE' and batches:
+            return self._stream_string(sql, params)
+        return self._execute_string(sql, params, ignore_results=(response == 'NONE'))
+
+    def _cached_result(
+        self,
+        key: tuple,
+        run: Callable[[], Any],
+    ) -> Any:
+        """
+        Return run(), reusing its result for result_cache_ttl seconds
+        Callers get their own copy of a cached DataFrame, list, and each dict row
+        """
+        try:
+            cached = self._result_cache.get(key)
+        except TypeError:
+            # Unhashable bind values cannot key the cache
+            return run()
+        if cached and time.monotonic() - cached[0] < self.result_cache_ttl:
+            self._result_cache.move_to_end(key)
+            result = cached[1]
+        else:
+            result = run()
+            self._result_cache[key] = (time.monotonic(), result)
+            if len(self._result_cache) > self.result_cache_size:
+                self._result_cache.popitem(last=False)
+        if isinstance(result, pd.DataFrame):
+            return result.copy()
+        if isinstance(result, list):
+            return [dict(row) if isinstance(row, dict) else row for row in result]
+        return result
+
     def _execute_dict_cursor(
         self,
         query: str,
+        params: Optional[dict] = None,
     ) -> List[dict]:
         """
         Run a query string and return results in a Snowflake DictCursor
@@ -568,7 +967,7 @@ class SnowflakeDataWarehouse(DataWarehouse):
         cursor = None
         try:
             cursor = self.connection.cursor(sf_connector.DictCursor)
-            query_return = cursor.execute(query).fetchall()
+            query_return = cursor.execute(query, params).fetchall()
             return query_return
         except Exception as e:
             self._error_handler(e)
@@ -576,21 +975,85 @@ class SnowflakeDataWarehouse(DataWarehouse):
             if cursor:
                 cursor.close()
 
+    def _execute_arrow_cursor(
+        self,
+        query: str,
+        params: Optional[dict] = None,
+        batches: Optional[bool] = False,
+    ) -> Union[pa.Table, Iterator[pa.Table]]:
+        """
+        Run a query string and return results in a pyarrow Table
+        Result chunks arrive as Arrow, so this skips building pandas columns
+        """
+        if batches:
+            return self._execute_arrow_batches(query, params)
+        cursor = None
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute(query, params)
+            return cursor.fetch_arrow_all(force_return_table=True)
+        except Exception as e:
+            self._error_handler(e)
+        finally:
+            if cursor:
+                cursor.close()
+
+    def _execute_arrow_batches(
+        self,
+        query: str,
+        params: Optional[dict] = None,
+    ) -> Iterator[pa.Table]:
+        """
+        Run a query string and yield results one pyarrow Table per result chunk
+        The cursor is held open until the last batch has been read
+        """
+        cursor = None
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute(query, params)
+            yield from cursor.fetch_arrow_batches()
+        except Exception as e:
+            self._error_handler(e)
+        finally:
+            if cursor:
+                cursor.close()
+
+    def _execute_dict_rows(
+        self,
+        query: str,
+        params: Optional[dict] = None,
+    ) -> Iterator[dict]:
+        """
+        Run a query string and yield results one row dict at a time
+        The connector downloads result chunks as they are read, so only
+        the current chunk is held in memory instead of every row
+        """
+        cursor = None
+        try:
+            cursor = self.connection.cursor(sf_connector.DictCursor)
+            cursor.execute(query, params)
+            yield from cursor
+        except Exception as e:
+            self._error_handler(e)
+        finally:
+            if cursor:
+                cursor.close()
+
     def _execute_df_cursor(
         self,
         query: str,
         params: Optional[dict] = None,
         batches: Optional[bool] = False,
-    ) -> pd.DataFrame:
+    ) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
         """
         Run a query string and return results in a pandas DataFrame
         """
+        if batches:
+            return self._execute_df_batches(query, params)
         cursor = None
         try:
             cursor = self.connection.cursor()
             cursor.execute(query, params)
-            if batches:
-                return cursor.fetch_pandas_batches()
             return cursor.fetch_pandas_all()
         except Exception as e:
             self._error_handler(e)
@@ -598,27 +1061,103 @@ class SnowflakeDataWarehouse(DataWarehouse):
             if cursor:
                 cursor.close()
 
-    def _execute_string(
+    def _execute_df_batches(
         self,
         query: str,
-        ignore_results: bool = False,
-    ) -> List[tuple]:
+        params: Optional[dict] = None,
+    ) -> Iterator[pd.DataFrame]:
         """
-        Execute a query string against the Data Warehouse connection and fetch all results
+        Run a query string and yield results one result chunk at a time
+        The cursor is held open until the last batch has been read
         """
-        query_returns = []
         cursor = None
         try:
-            for cursor in self.connection.execute_string(query, return_cursors=(not ignore_results)):
-                for query_return in cursor:
-                    query_returns.append(query_return)
-            return query_returns
+            cursor = self.connection.cursor()
+            cursor.execute(query, params)
+            yield from cursor.fetch_pandas_batches()
         except Exception as e:
             self._error_handler(e)
         finally:
             if cursor:
                 cursor.close()
 
+    def _execute_string(
+        self,
+        query: str,
+        params: Optional[dict] = None,
+        ignore_results: bool = False,
+    ) -> List[tuple]:
+        """
+        Execute a query string against the Data Warehouse connection and fetch all results
+        """
+        return list(self._stream_string(query, params, ignore_results))
+
+    def _stream_string(
+        self,
+        query: str,
+        params: Optional[dict] = None,
+        ignore_results: bool = False,
+    ) -> Iterator[tuple]:
+        """
+        Execute a query string against the Data Warehouse connection and yield
+        each statement's rows as they are read, so a caller can start on the
+        first statement's results while later statements have yet to run
+        Multi-statement strings cannot bind values, so a query with params runs as a single statement
+        """
+        try:
+            if params:
+                with self.connection.cursor() as cursor:
+                    cursor.execute(query, params)
+                    if not ignore_results:
+                        yield from cursor
+                return
+            # execute_stream runs one statement at a time, so each cursor is
+            # closed before the next statement opens another
+            for cursor in self.connection.execute_stream(io.StringIO(query)):
+                with cursor:
+                    if not ignore_results:
+                        yield from cursor
+        except Exception as e:
+            self._error_handler(e)
+
+    def _stage_and_copy(
+        self,
+        df: pd.DataFrame,
+        fqtn: str,
+        chunksize: int,
+    ) -> List[tuple]:
+        """
+        Loads DataFrame rows into an existing table through a temporary stage
+        Every Parquet file is written to one local directory first, so a single
+        PUT uploads them in parallel instead of one PUT per chunk, then
+        one COPY reads the whole stage. Returns the COPY result rows
+        """
+        # The COPY bypasses execute_query, so forget cached results here
+        self._result_cache.clear()
+        database, schema, _ = self.parse_fqtn(fqtn)
+        stage = f"{database}.{schema}.RQL_STAGE_{uuid.uuid4().hex.upper()}"
+        with TemporaryDirectory() as tmp, self.connection.cursor() as cursor:
+            for number, start in enumerate(range(0, max(len(df), 1), chunksize)):
+                df.iloc[start : start + chunksize].to_parquet(
+                    os.path.join(tmp, f"part-{number:05d}.parquet"),
+                    index=False,
+                    compression='snappy',
+                )
+            cursor.execute(f"CREATE TEMPORARY STAGE {stage} FILE_FORMAT=(TYPE=PARQUET)")
+            try:
+                cursor.execute(
+                    f"PUT 'file://{Path(tmp).as_posix()}/*' @{stage} "
+                    f"PARALLEL={self.upload_parallel} AUTO_COMPRESS=FALSE"
+                )
+                scanner = " USE_VECTORIZED_SCANNER=TRUE" if self.use_vectorized_scanner else ""
+                return cursor.execute(
+                    f"COPY INTO {fqtn} FROM @{stage} "
+                    f"FILE_FORMAT=(TYPE=PARQUET{scanner}) MATCH_BY_COLUMN_NAME=CASE_INSENSITIVE"
+                ).fetchall()
+            finally:
+                # Reused sessions keep temporary stages alive, so drop it now
+                cursor.execute(f"DROP STAGE IF EXISTS {stage}")
+
 
 def convert_to_type(type_code: int, precision: int, scale: int) -> str:
     """
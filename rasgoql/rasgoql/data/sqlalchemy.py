@@ -3,20 +3,25 @@ Generic SQLAlchemy DataWarehouse classes
 """
 from __future__ import annotations
 from abc import abstractmethod
+from contextlib import contextmanager
+from functools import lru_cache
 import logging
-from typing import List, Optional, Tuple, Union
+from operator import itemgetter
+import threading
+from typing import Callable, Iterator, List, Optional, Tuple, Union
 from urllib.parse import quote_plus as urlquote
 
 import pandas as pd
 
-from rasgoql.data.base import DataWarehouse, DWCredentials
+from rasgoql.data.base import READ_ONLY_PREFIXES, DataWarehouse, DWCredentials
 from rasgoql.errors import (
     DWConnectionError,
+    PackageDependencyWarning,
     SQLWarning,
     TableAccessError,
     TableConflictException,
 )
-from rasgoql.imports import alchemy_engine, alchemy_session, alchemy_exceptions
+from rasgoql.imports import alchemy_connection, alchemy_engine, alchemy_exceptions, alchemy_text, pa
 from rasgoql.primitives.enums import (
     check_response_type,
     check_table_type,
@@ -24,12 +29,58 @@ from rasgoql.primitives.enums import (
 )
 from rasgoql.utils.df import cleanse_sql_dataframe, generate_dataframe_ddl
 from rasgoql.utils.messaging import verbose_message
-from rasgoql.utils.sql import is_scary_sql
+from rasgoql.utils.sql import is_scary_sql, random_table_name
 
 logging.basicConfig()
 logger = logging.getLogger("SQLAlchemy DataWarehouse")
 logger.setLevel(logging.INFO)
 
+# Pulls the (name, type) pair out of a column description row in one call
+name_and_type = itemgetter("name", "type")
+
+# Number of rows fetched per round trip and per DataFrame chunk
+DF_CHUNKSIZE = 10_000
+# Execution options that ask the driver for a server-side cursor and fetch
+# DF_CHUNKSIZE rows per round trip from the first fetch (yield_per) rather
+# than growing the buffer up to that size (max_row_buffer, SQLAlchemy < 1.4.40)
+STREAM_OPTIONS = {"stream_results": True, "max_row_buffer": DF_CHUNKSIZE, "yield_per": DF_CHUNKSIZE}
+
+# Most bind params the Postgres wire protocol (and so Redshift) allows per statement
+MAX_BIND_PARAMS = 32767
+
+# Fixed catalog queries, kept at module level so every call hands the same
+# text to _statement and reuses one compiled statement per engine
+COLUMNS_SQL = (
+    "SELECT column_name AS name, data_type AS type "
+    "FROM INFORMATION_SCHEMA.COLUMNS "
+    "WHERE table_schema = :schema AND table_name = :table "
+    "ORDER BY ordinal_position"
+)
+DDL_SQL = (
+    "select table_schema, table_name, column_name, data_type, "
+    "character_maximum_length, column_default, is_nullable from "
+    "INFORMATION_SCHEMA.COLUMNS where table_name = :table "
+    "and table_schema = :schema;"
+)
+LIST_TABLES_SQL = (
+    "SELECT TABLE_NAME, "
+    "TABLE_CATALOG||'.'||TABLE_SCHEMA||'.'||TABLE_NAME AS FQTN, "
+    "CASE TABLE_TYPE WHEN 'BASE TABLE' THEN 'TABLE' ELSE TABLE_TYPE END AS TABLE_TYPE "
+    "FROM {catalog}INFORMATION_SCHEMA.TABLES"
+)
+LIST_TABLES_IN_SCHEMA_SQL = LIST_TABLES_SQL + " WHERE TABLE_SCHEMA = :schema"
+
+
+@lru_cache(maxsize=256)
+def _statement(query: str):
+    """
+    Returns a text() construct for the query, built once per distinct query string
+    Reusing the same object skips re-parsing its bind params and gives the
+    engine's compiled cache a stable key to hit on repeat calls
+    """
+    return alchemy_text(query)
+
+
 # Each DB derived from the generic SQLAlchemy class will have slightly
 # different connection strings. Build a unique Credentials class for each DB
 
@@ -41,11 +92,25 @@ class SQLAlchemyDataWarehouse(DataWarehouse):
 
     dw_type = None
     credentials_class = None
+    # Keep warm connections around for concurrent callers, hand back the most
+    # recently used one first, and let idle overflow connections close quickly
+    pool_options = {
+        "pool_size": 10,
+        "max_overflow": 20,
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+        "pool_use_lifo": True,
+    }
+    # Passed to DataFrame.to_sql by save_df, override to use a faster
+    # DB-specific bulk insert
+    insert_method: Optional[Union[str, Callable]] = None
+    insert_chunksize: int = 1000
 
     def __init__(self):
         super().__init__()
         self.credentials: Optional[Union[dict, DWCredentials]]
-        self.connection: alchemy_session
+        self.engine: Optional[alchemy_engine] = None
+        self._local = threading.local()
         self.database = None
         self.schema = None
 
@@ -76,10 +141,15 @@ class SQLAlchemyDataWarehouse(DataWarehouse):
             credentials = credentials.to_dict()
 
         try:
+            # Reconnecting replaces the engine, so release the old pool rather
+            # than leave two sets of open connections behind
+            if self.engine:
+                self.engine.dispose()
+            self.clear_object_cache()
             self.credentials = credentials
             self.database = credentials.get("database")
             self.schema = credentials.get("schema")
-            self.connection = alchemy_session(self._engine, autocommit=True)
+            self.engine = self._engine
         except Exception as e:
             self._error_handler(e)
 
@@ -88,9 +158,9 @@ class SQLAlchemyDataWarehouse(DataWarehouse):
         Close connection
         """
         try:
-            if self.connection:
-                self.connection.close()
-            self.connection = None
+            if self.engine:
+                self.engine.dispose()
+            self.engine = None
             verbose_message("Connection closed", logger)
         except Exception as e:
             self._error_handler(e)
@@ -121,15 +191,16 @@ class SQLAlchemyDataWarehouse(DataWarehouse):
         """
         table_type = check_table_type(table_type)
         fqtn = self.magic_fqtn_handler(fqtn, self.default_namespace)
-        if self._table_exists(fqtn=fqtn) and not overwrite:
-            msg = (
-                f"A table or view named {fqtn} already exists. "
-                "If you are sure you want to overwrite it, "
-                "pass in overwrite=True and run this function again"
-            )
-            raise TableConflictException(msg)
-        query = f"CREATE OR REPLACE {table_type} {fqtn} AS {sql}"
-        self.execute_query(query, acknowledge_risk=True, response="None")
+        with self._connection():
+            if not overwrite and self._table_exists(fqtn=fqtn):
+                msg = (
+                    f"A table or view named {fqtn} already exists. "
+                    "If you are sure you want to overwrite it, "
+                    "pass in overwrite=True and run this function again"
+                )
+                raise TableConflictException(msg)
+            query = f"CREATE OR REPLACE {table_type} {fqtn} AS {sql}"
+            self.execute_query(query, acknowledge_risk=True, response="None")
         return fqtn
 
     @property
@@ -151,21 +222,28 @@ class SQLAlchemyDataWarehouse(DataWarehouse):
         sql: str,
         response: str = "tuple",
         acknowledge_risk: bool = False,
+        params: Optional[dict] = None,
+        batches: bool = False,
         **kwargs,
-    ) -> Union[list[dict], pd.DataFrame, list[tuple], None]:
+    ) -> Union[list[dict], pd.DataFrame, Iterator[pd.DataFrame], list[tuple], None]:
         """
         Run a query against DB and return all results
         `sql`: str:
             query text to execute
         `response`: str:
-            Possible values: [dict, df, None]
+            Possible values: [arrow, dict, df, None]
         `acknowledge_risk`: bool:
             pass True when you know your SQL statement contains
             a potentially dangerous or data-altering operation
             and still want to run it against your DataWarehouse
+        `params`: dict:
+            values to bind to :named parameters in the query text
+        `batches`: bool:
+            when response is df or arrow, return an iterator of
+            DataFrames or Arrow tables instead of a single one
         """
         response = check_response_type(response)
-        if is_scary_sql(sql) and not acknowledge_risk:
+        if not acknowledge_risk and is_scary_sql(sql):
             msg = (
                 "It looks like your SQL statement contains a "
                 "potentially dangerous or data-altering operation."
@@ -173,39 +251,34 @@ class SQLAlchemyDataWarehouse(DataWarehouse):
                 "pass in acknowledge_risk=True and run this function again."
             )
             raise SQLWarning(msg)
-        verbose_message(f"Executing query: {sql}", logger)
-        if response == "DICT":
-            return self._query_into_dict(sql)
-        if response == "DF":
-            return self._query_into_df(sql)
-        return self._execute_string(sql, ignore_results=(response == "NONE"))
+        verbose_message("Executing query: %s", logger, sql)
+        read_only = sql.lstrip().lower().startswith(READ_ONLY_PREFIXES)
+        if not read_only:
+            self.clear_object_cache()
+        try:
+            return self._run_query(sql, response, params, batches)
+        except alchemy_exceptions.DBAPIError as e:
+            # A pooled connection the server has dropped fails on first use and is
+            # invalidated, so a read can safely run again on a fresh connection
+            if not (read_only and e.connection_invalidated and getattr(self._local, "conn", None) is None):
+                raise
+            verbose_message("Connection was dropped, retrying query once", logger)
+            return self._run_query(sql, response, params, batches)
 
-    @abstractmethod
     def get_ddl(self, fqtn: str) -> pd.DataFrame:
         """
         Returns a DataFrame describing the column in the table
-        This method should be overridden by derived classes since optimal DDL
-        selection will vary by DB type
         `fqtn`: str:
             Fully-qualified Table Name (database.schema.table)
         """
         fqtn = self.magic_fqtn_handler(fqtn, self.default_namespace)
-        db_name, schema_name, table_name = self.parse_fqtn(fqtn)
-        sql = (
-            f"select table_schema, table_name, column_name, data_type, "
-            f"character_maximum_length, column_default, is_nullable from "
-            f"INFORMATION_SCHEMA.COLUMNS where table_name = '{table_name}' "
-            f"and table_schema = '{schema_name}';"
-        )
-        query_response = self.execute_query(sql, response="DF")
-        return query_response
+        schema, table = self.parse_table_and_schema_from_fqtn(fqtn)
+        sql, params = self._ddl_sql(schema, table)
+        return self.execute_query(sql, response="DF", params=params)
 
-    @abstractmethod
     def get_object_details(self, fqtn: str) -> tuple:
         """
         Return details of a table or view
-        This method should be overridden by derived classes since optimal DDL
-        selection will vary by DB type
         Params:
         `fqtn`: str:
             Fully-qualified table name (database.schema.table)
@@ -215,15 +288,9 @@ class SQLAlchemyDataWarehouse(DataWarehouse):
             object type: [table|view|unknown]
         """
         fqtn = self.magic_fqtn_handler(fqtn, self.default_namespace)
-        database, schema, table = self.parse_fqtn(fqtn)
-        sql = f"SHOW OBJECTS LIKE '{table}' IN {database}.{schema}"
-        result = self.execute_query(sql, response="dict")
-        obj_exists = len(result) > 0
+        obj_exists = self._table_exists(fqtn)
         is_rasgo_obj = False
         obj_type = "unknown"
-        if obj_exists:
-            is_rasgo_obj = result[0].get("comment") == "rasgoql"
-            obj_type = result[0].get("kind")
         return obj_exists, is_rasgo_obj, obj_type
 
     def get_schema(
@@ -238,35 +305,28 @@ class SQLAlchemyDataWarehouse(DataWarehouse):
             Either a Fully-qualified table name (database.schema.table)
             or a SQL select statement that will create a view.
         """
-        query_sql = (
-            "SELECT * FROM INFORMATION_SCHEMA.TABLES "
-            "WHERE table_catalog = '{database}' "
-            "AND table_schema = '{schema}' "
-            "AND table_name = '{table}'"
-        )
         # Check for SQL
         if self._is_select_statement(fqtn_or_sql):
-            self.create(fqtn_or_sql, "temp_schema", table_type="view", overwrite=True)
-            query_response = self.execute_query(
-                query_sql.format(database=self.database, schema=self.schema, table="temp_schema"),
-                response="dict",
-            )
-            self.execute_query(
-                "DROP VIEW temp_schema",
-                response="none",
-                acknowledge_risk=True,
-            )
-            return [(row["name"], row["type"]) for row in query_response]
+            try:
+                with self._connection() as conn:
+                    return self._describe_select(conn, fqtn_or_sql)
+            except Exception as e:
+                self._error_handler(e)
         # Otherwise assume fqtn:
         fqtn = self.magic_fqtn_handler(fqtn_or_sql, self.default_namespace)
-        database, schema, table = self.parse_fqtn(fqtn)
-        if self._table_exists(fqtn):
+        schema, table = self.parse_table_and_schema_from_fqtn(fqtn)
+        # Any table with columns comes back in the lookup itself, so only an empty
+        # result needs the existence check to tell a missing table apart
+        with self._connection():
             query_response = self.execute_query(
-                query_sql.format(database=database, schema=schema, table=table), response="dict"
+                COLUMNS_SQL,
+                acknowledge_risk=True,
+                response="dict",
+                params={"schema": schema, "table": table},
             )
-            return [(row["name"], row["type"]) for row in query_response]
-        else:
-            raise TableAccessError(f"Table {fqtn} does not exist or cannot be accessed.")
+            if query_response or self._table_exists(fqtn):
+                return list(map(name_and_type, query_response))
+        raise TableAccessError(f"Table {fqtn} does not exist or cannot be accessed.")
 
     def list_tables(self, database: str = None, schema: str = None) -> pd.DataFrame:
         """
@@ -277,17 +337,16 @@ class SQLAlchemyDataWarehouse(DataWarehouse):
         `schema`: str:
             override schema
         """
-        select_clause = (
-            "SELECT TABLE_NAME, "
-            "TABLE_CATALOG||'.'||TABLE_SCHEMA||'.'||TABLE_NAME AS FQTN, "
-            "CASE TABLE_TYPE WHEN 'BASE TABLE' THEN 'TABLE' ELSE TABLE_TYPE END AS TABLE_TYPE"
-        )
-        from_clause = " FROM INFORMATION_SCHEMA.TABLES "
-        if database:
-            from_clause = f" FROM {database.upper()}.INFORMATION_SCHEMA.TABLES "
-        where_clause = f" WHERE TABLE_SCHEMA = '{schema.upper()}'" if schema else ""
-        sql = select_clause + from_clause + where_clause
-        return self.execute_query(sql, response="df", acknowledge_risk=True)
+        sql = LIST_TABLES_IN_SCHEMA_SQL if schema else LIST_TABLES_SQL
+        sql = sql.format(catalog=f"{database.upper()}." if database else "")
+        params = {"schema": schema.upper()} if schema else None
+        df = self.execute_query(sql, response="df", acknowledge_risk=True, params=params)
+        # Only a handful of distinct table types, store them once rather than per row.
+        # Unquoted aliases come back lower cased on some DBs, so match either way
+        for column in df.columns:
+            if column.upper() == "TABLE_TYPE":
+                df[column] = df[column].astype("category")
+        return df
 
     def preview(self, sql: str, limit: int = 10) -> pd.DataFrame:
         """
@@ -298,14 +357,19 @@ class SQLAlchemyDataWarehouse(DataWarehouse):
         `limit`: int:
             Records to return
         """
-        return self.execute_query(f"{sql} LIMIT {limit}", response="df", acknowledge_risk=True)
+        # Wrap rather than append so queries that already end in a semicolon or
+        # carry their own LIMIT still work. The limit is inlined rather than bound,
+        # since some drivers reject a placeholder in LIMIT
+        query = f"SELECT * FROM ({sql.strip().rstrip(';')}) AS rql_preview LIMIT {int(limit)}"
+        return self.execute_query(query, response="df", acknowledge_risk=True)
 
-    def save_df(self, df: pd.DataFrame, fqtn: str, method: str = None) -> str:
+    def save_df(self, df: pd.DataFrame, fqtn: str, method: str = None, chunksize: int = None) -> str:
         """
         Creates a table from a pandas Dataframe
         Params:
         `df`: pandas DataFrame:
             DataFrame to upload
+            its column names are made SQL compliant in place, without a copy
         `fqtn`: str:
             Fully-qualied table name (database.schema.table)
             Name for the new table
@@ -315,37 +379,33 @@ class SQLAlchemyDataWarehouse(DataWarehouse):
             pass append: to add dataframe rows to it
             pass replace: to overwrite it with dataframe rows
                 WARNING: This will completely overwrite data in the existing table
+        `chunksize`: int
+            rows sent per INSERT batch, defaults to insert_chunksize
         """
         if method:
             method = check_write_method(method)
         fqtn = self.magic_fqtn_handler(fqtn, self.default_namespace)
         database, schema, table = self.parse_fqtn(fqtn)
-        table_exists = self._table_exists(fqtn)
-        if table_exists and not method:
-            msg = (
-                f"A table named {fqtn} already exists. "
-                "If you are sure you want to write over it, pass in "
-                "method='append' or method='replace' and run this function again"
-            )
-            raise TableConflictException(msg)
-        try:
-            cleanse_sql_dataframe(df)
-            # If the table does not exist or we've received instruction to replace
-            # Issue a create or replace statement before we insert data
-            if not table_exists or method == "REPLACE":
-                create_stmt = generate_dataframe_ddl(df, fqtn)
-                self.execute_query(create_stmt, response="None", acknowledge_risk=True)
-            df.to_sql(
-                table,
-                self._engine,
-                schema=schema,
-                if_exists=method.lower(),
-                index=False,
-                chunksize=1000,
-            )
-            return fqtn
-        except Exception as e:
-            self._error_handler(e)
+        with self._connection() as conn:
+            table_exists = self._table_exists(fqtn)
+            if table_exists and not method:
+                msg = (
+                    f"A table named {fqtn} already exists. "
+                    "If you are sure you want to write over it, pass in "
+                    "method='append' or method='replace' and run this function again"
+                )
+                raise TableConflictException(msg)
+            try:
+                cleanse_sql_dataframe(df)
+                # If the table does not exist or we've received instruction to replace
+                # Issue a create or replace statement before we insert data
+                create_stmt = None
+                if not table_exists or method == "REPLACE":
+                    create_stmt = generate_dataframe_ddl(df, fqtn)
+                self._write_df(df, conn, schema, table, create_stmt, chunksize)
+                return fqtn
+            except Exception as e:
+                self._error_handler(e)
 
     # ---------------------------
     # Core Data Warehouse helpers
@@ -353,22 +413,101 @@ class SQLAlchemyDataWarehouse(DataWarehouse):
     def _table_exists(self, fqtn: str) -> bool:
         """
         Check for existence of fqtn in the Data Warehouse and return a boolean
+        Answers are reused for object_cache_ttl seconds, and any statement
+        run through execute_query that may change tables clears them
         Params:
         `fqtn`: str:
-            Fully-qualified table name (database.schema.table)
+            Fully-qualified table name (database.schema.table), already
+            resolved by the calling method's magic_fqtn_handler
         """
-        fqtn = self.magic_fqtn_handler(fqtn, self.default_namespace)
-        do_i_exist, _, _ = self.get_object_details(fqtn)
-        return do_i_exist
+        return self._cached_lookup(fqtn, self._lookup_table_exists)
 
     # --------------------------
     # SQLAlchemy and derived class helpers
     # --------------------------
+    def _lookup_table_exists(self, fqtn: str) -> bool:
+        """
+        Queries the DB for the existence of fqtn
+        """
+        schema, table = self.parse_table_and_schema_from_fqtn(fqtn)
+        sql, params = self._object_exists_sql(schema, table)
+        return len(self.execute_query(sql, acknowledge_risk=True, response="dict", params=params)) > 0
+
+    def _write_df(
+        self,
+        df: pd.DataFrame,
+        conn: alchemy_connection,
+        schema: str,
+        table: str,
+        create_stmt: Optional[str] = None,
+        chunksize: Optional[int] = None,
+    ) -> None:
+        """
+        Inserts DataFrame rows into a table, first running create_stmt when save_df passes one
+        The DDL and the inserts share one transaction, so the table is created and
+        loaded with a single commit instead of autocommitting the DDL on its own
+        Override this method in derived classes whose DB has a faster bulk loader
+        """
+        chunksize = chunksize or self.insert_chunksize
+        if self.insert_method == "multi":
+            # Every value in a multi-row INSERT is its own bind param
+            chunksize = max(1, min(chunksize, MAX_BIND_PARAMS // max(len(df.columns), 1)))
+        with conn.begin():
+            if create_stmt:
+                self.clear_object_cache()
+                conn.exec_driver_sql(create_stmt)
+            df.to_sql(
+                table,
+                conn,
+                schema=schema,
+                if_exists="append",
+                index=False,
+                chunksize=chunksize,
+                method=self.insert_method,
+            )
+
+    def parse_table_and_schema_from_fqtn(self, fqtn: str) -> tuple:
+        """
+        Accepts a possible FQTN and returns the schema and table from it
+        """
+        return tuple(self.parse_fqtn(fqtn)[-2:])
+
+    def _describe_select(self, conn: alchemy_connection, sql: str) -> List[Tuple[str, str]]:
+        """
+        Returns the (name, type) of each column a SELECT statement produces
+        Creates, describes, and drops a probe view inside one transaction
+        Override this method in derived classes that can describe a query without DDL
+        """
+        temp_fqtn = self.magic_fqtn_handler(random_table_name().lower(), self.default_namespace)
+        schema, table = self.parse_table_and_schema_from_fqtn(temp_fqtn)
+        with conn.begin():
+            conn.execute(alchemy_text(f"CREATE VIEW {schema}.{table} AS {sql}"))
+            query_response = conn.execute(_statement(COLUMNS_SQL), {"schema": schema, "table": table}).mappings().all()
+            conn.execute(alchemy_text(f"DROP VIEW {schema}.{table}"))
+        return list(map(name_and_type, query_response))
+
+    def _ddl_sql(self, schema: str, table: str) -> Tuple[str, Optional[dict]]:
+        """
+        Returns the query (and its bind params) used by `get_ddl` to describe a table
+        Override this method in derived classes whose DB does not
+        support INFORMATION_SCHEMA.COLUMNS
+        """
+        return DDL_SQL, {"schema": schema, "table": table}
+
+    @abstractmethod
+    def _object_exists_sql(self, schema: str, table: str) -> Tuple[str, Optional[dict]]:
+        """
+        Returns the query (and its bind params) used by `get_object_details`
+        This method should be overridden by derived classes since catalog
+        lookups vary by DB type. The query must return rows only when the object exists
+        """
+        raise NotImplementedError()
+
     @property
     @abstractmethod
     def _engine(self):
         """
-        Returns a SQLAlchemy engine
+        Returns a new SQLAlchemy engine
         """
         engine_url = (
             f"{self.credentials.get('dw_type')}://"
@@ -378,13 +517,13 @@ class SQLAlchemyDataWarehouse(DataWarehouse):
             f"{self.credentials.get('port')}/"
             f"{self.credentials.get('database')}"
         )
-        return alchemy_engine(engine_url)
+        return alchemy_engine(engine_url, **self.pool_options)
 
     def _error_handler(self, exception: Exception, query: str = None) -> None:
         """
         Handle SQLAlchemy exceptions that need additional info
         """
-        verbose_message(f"Exception occurred while running query: {query}", logger)
+        verbose_message("Exception occurred while running query: %s", logger, query)
         if exception is None:
             return
         if isinstance(exception, alchemy_exceptions.DisconnectionError):
@@ -393,43 +532,154 @@ class SQLAlchemyDataWarehouse(DataWarehouse):
             ) from exception
         raise exception
 
-    def _execute_string(self, query: str, ignore_results: bool = False) -> list[tuple]:
+    @contextmanager
+    def _connection(self) -> Iterator[alchemy_connection]:
+        """
+        Yields the connection this thread already has checked out, or checks one
+        out of the pool for the length of the block
+        Wrap methods that run several queries (existence check, DDL, insert) in this
+        so the nested execute_query calls share one checkout and one pre-ping
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            yield conn
+            return
+        with self.engine.connect() as conn:
+            self._local.conn = conn
+            try:
+                yield conn
+            finally:
+                self._local.conn = None
+
+    def _run_query(
+        self,
+        sql: str,
+        response: str,
+        params: Optional[dict] = None,
+        batches: bool = False,
+    ) -> Union[list[dict], pd.DataFrame, Iterator[pd.DataFrame], list[tuple], None]:
+        """
+        Sends a query to the executor matching a checked response type
+        """
+        if response == "DICT":
+            return self._query_into_dict(sql, params)
+        if response == "DF":
+            return self._query_into_df(sql, params, batches=batches)
+        if response == "ARROW":
+            return self._query_into_arrow(sql, params, batches=batches)
+        return self._execute_string(sql, params, ignore_results=(response == "NONE"))
+
+    def _stream_selects(self, conn: alchemy_connection, query: str) -> alchemy_connection:
+        """
+        Returns a connection that reads SELECT results through a server-side cursor
+        so rows arrive DF_CHUNKSIZE at a time instead of all being buffered by the driver
+        Other statements (DDL, DML) cannot run on a server-side cursor and are left alone
+        """
+        if self._is_select_statement(query):
+            return conn.execution_options(**STREAM_OPTIONS)
+        return conn
+
+    def _execute_string(
+        self,
+        query: str,
+        params: Optional[dict] = None,
+        ignore_results: bool = False,
+    ) -> list[tuple]:
         """
         Execute a query string against the DataWarehouse connection and fetch all results
         """
         try:
-            results = self.connection.execute(query)
-            if ignore_results:
-                return
-            return list(results)
+            with self._connection() as conn:
+                conn = self._stream_selects(conn, query)
+                results = conn.execute(_statement(query), params)
+                if ignore_results:
+                    return
+                return list(results)
         except Exception as e:
             self._error_handler(e)
 
-    def _query_into_dict(self, query: str) -> list[dict]:
+    def _query_into_dict(self, query: str, params: Optional[dict] = None) -> list[dict]:
         """
-        Run a query string and return results in a Snowflake DictCursor
+        Run a query string and return results as a list of dict-like rows
         PRO:
         Results are callable by column name
         for row in data:
             row['COL_NAME']
         CON:
-        Query string must be a single statement (only one ;) or Snowflake returns an error
+        Query string must be a single statement (only one ;)
+        """
+        try:
+            with self._connection() as conn:
+                conn = self._stream_selects(conn, query)
+                return conn.execute(_statement(query), params).mappings().all()
+        except Exception as e:
+            self._error_handler(e)
+
+    def _query_into_df(
+        self,
+        query: str,
+        params: Optional[dict] = None,
+        batches: bool = False,
+    ) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+        """
+        Run a query string and return results in a pandas DataFrame
+        Rows are read in chunks of DF_CHUNKSIZE so they go straight into
+        column blocks instead of a full list of Row objects
         """
+        if batches:
+            return self._query_into_df_batches(query, params)
         try:
-            query_return = self.connection.execute(query).__dict__
-            return query_return
+            with self._connection() as conn:
+                conn = self._stream_selects(conn, query)
+                chunks = pd.read_sql_query(
+                    _statement(query),
+                    conn,
+                    params=params,
+                    chunksize=DF_CHUNKSIZE,
+                )
+                return pd.concat(chunks, ignore_index=True)
         except Exception as e:
             self._error_handler(e)
 
-    def _query_into_df(self, query: str) -> pd.DataFrame:
+    def _query_into_arrow(
+        self,
+        query: str,
+        params: Optional[dict] = None,
+        batches: bool = False,
+    ) -> Union["pa.Table", Iterator["pa.Table"]]:
+        """
+        Run a query string and return results in a pyarrow Table
+        Override this method in derived classes whose driver can read Arrow directly
+        """
+        if pa is None:
+            raise PackageDependencyWarning(
+                "Missing a required python package to return Arrow results. "
+                "Please download it by running: pip install pyarrow"
+            )
+        if batches:
+            return (
+                pa.Table.from_pandas(df, preserve_index=False)
+                for df in self._query_into_df(query, params, batches=True)
+            )
+        return pa.Table.from_pandas(self._query_into_df(query, params), preserve_index=False)
+
+    def _query_into_df_batches(
+        self,
+        query: str,
+        params: Optional[dict] = None,
+    ) -> Iterator[pd.DataFrame]:
         """
-        Run
+        Run a query string and yield results in pandas DataFrames of DF_CHUNKSIZE rows
+        The connection is held until the last batch has been read
         """
         try:
-            query_result = self.connection.execute(query)
-            query_return_df = pd.DataFrame(query_result.all())
-            response_cols = list(query_result.keys())
-            query_return_df.columns = response_cols
-            return query_return_df
+            with self.engine.connect() as conn:
+                conn = self._stream_selects(conn, query)
+                yield from pd.read_sql_query(
+                    _statement(query),
+                    conn,
+                    params=params,
+                    chunksize=DF_CHUNKSIZE,
+                )
         except Exception as e:
             self._error_handler(e)
@@ -2,7 +2,8 @@
 Manage Data Warehouse specific imports
 """
 import logging
-import pkg_resources
+import threading
+
 import requests
 
 logging.basicConfig()
@@ -24,20 +25,30 @@ logger.setLevel(logging.INFO)
 # from the class or function that needs the import
 ### ------------
 
-# Check for latest version of rasgotransforms package and prompt user
-transforms_version = pkg_resources.get_distribution("rasgotransforms").version
-try:
-    response = requests.get('https://pypi.org/pypi/rasgotransforms/json')
-    latest_version = response.json()['info']['version']
-except:
-    latest_version = transforms_version
-if transforms_version != latest_version:
-    logger.warning(
-        'You are not running the lastest version of rasgotransforms. '
-        'RasgoQL relies on this package to serve transform templates. '
-        'Please consider running `pip install rasgotransforms --upgrade` '
-        'to download our full library of SQL transforms.'
-    )
+
+def _check_transforms_version():
+    """
+    Check for latest version of rasgotransforms package and prompt user
+    Runs on a daemon thread, so importing rasgoql never waits on PyPI
+    """
+    import pkg_resources
+
+    transforms_version = pkg_resources.get_distribution("rasgotransforms").version
+    try:
+        response = requests.get('https://pypi.org/pypi/rasgotransforms/json', timeout=10)
+        latest_version = response.json()['info']['version']
+    except:
+        latest_version = transforms_version
+    if transforms_version != latest_version:
+        logger.warning(
+            'You are not running the lastest version of rasgotransforms. '
+            'RasgoQL relies on this package to serve transform templates. '
+            'Please consider running `pip install rasgotransforms --upgrade` '
+            'to download our full library of SQL transforms.'
+        )
+
+
+threading.Thread(target=_check_transforms_version, daemon=True).start()
 
 # Attempt safe imports of all DW packages so we can warn later if they are missing
 try:
@@ -61,13 +72,30 @@ try:
 except ImportError:
     gcp_flow = None
 
+try:
+    import adbc_driver_postgresql.dbapi as adbc_postgres
+except ImportError:
+    adbc_postgres = None
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+try:
+    import boto3
+except ImportError:
+    boto3 = None
+
 try:
     from sqlalchemy import create_engine as alchemy_engine
     from sqlalchemy import exc as alchemy_exceptions
+    from sqlalchemy import text as alchemy_text
+    from sqlalchemy.engine import Connection as alchemy_connection
     from sqlalchemy.engine import URL as alchemy_url
-    from sqlalchemy.orm import Session as alchemy_session
 except ImportError:
+    alchemy_connection = None
     alchemy_engine = None
     alchemy_exceptions = None
-    alchemy_session = None
+    alchemy_text = None
     alchemy_url = None
@@ -28,6 +28,12 @@ class RasgoQL:
         self._dw = connection()
         self._dw.connect(credentials)
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.disconnect_dw()
+
     def disconnect_dw(self):
         """
         Closes a connection to the Data Warehouse
@@ -72,6 +78,7 @@ class RasgoQL:
         Params:
         `df`: pandas DataFrame:
             DataFrame to upload
+            its column names are made SQL compliant in place, without a copy
         `table_name`: str:
             Name for the new table
         `method`: str
@@ -3,6 +3,7 @@ Enums
 """
 from enum import Enum
 import logging
+from typing import Dict, Type
 
 from rasgoql.errors import ParameterException
 
@@ -15,6 +16,14 @@ def _wrap_in_quotes(string: str) -> str:
     return f"'{string}'"
 
 
+def _member_values(enum: Type[Enum]) -> Dict[str, str]:
+    """
+    Maps each member name of an Enum to its value, so checks are one dict lookup
+    instead of an Enum lookup plus a .value descriptor call
+    """
+    return {member.name: member.value for member in enum}
+
+
 class TableState(Enum):
     """
     State of a table
@@ -25,14 +34,17 @@ class TableState(Enum):
     UNKNOWN = 'UNKNOWN'
 
 
+_TABLE_STATES = _member_values(TableState)
+
+
 def check_table_state(input_value: str):
     """
     Warn if an incorrect table state is passed
     """
-    table_states = _wrap_in_quotes("', '".join([e.value for e in TableState]))
     try:
-        output_value = TableState[input_value.upper()].value
+        output_value = _TABLE_STATES[input_value.upper()]
     except Exception:
+        table_states = _wrap_in_quotes("', '".join([e.value for e in TableState]))
         raise ParameterException(f'table_state parameter accepts values: {table_states}')
     return output_value
 
@@ -49,14 +61,17 @@ class TableType(Enum):
     VIEW = 'VIEW'
 
 
+_TABLE_TYPES = _member_values(TableType)
+
+
 def check_table_type(input_value: str):
     """
     Warn if an incorrect table type is passed
     """
-    table_types = _wrap_in_quotes("', '".join([e.value for e in TableType]))
     try:
-        output_value = TableType[input_value.upper()].value
+        output_value = _TABLE_TYPES[input_value.upper()]
     except Exception:
+        table_types = _wrap_in_quotes("', '".join([e.value for e in TableType]))
         logger.warning(
             f'{input_value} is an unexpected value for table_type. '
             f'Expected values are: {table_types}. '
@@ -77,14 +92,17 @@ class RenderMethod(Enum):
     VIEWS = 'VIEWS'
 
 
+_RENDER_METHODS = _member_values(RenderMethod)
+
+
 def check_render_method(input_value: str):
     """
     Warn if an incorrect render method is passed
     """
-    render_methods = _wrap_in_quotes("', '".join([e.value for e in RenderMethod]))
     try:
-        output_value = RenderMethod[input_value.upper()].value
+        output_value = _RENDER_METHODS[input_value.upper()]
     except Exception:
+        render_methods = _wrap_in_quotes("', '".join([e.value for e in RenderMethod]))
         raise ParameterException(f'render_method parameter accepts values: {render_methods}')
     return output_value
 
@@ -94,20 +112,24 @@ class ResponseType(Enum):
     Formats to return query results
     """
 
+    ARROW = 'ARROW'
     DICT = 'DICT'
     DF = 'DF'
     TUPLE = 'TUPLE'
     NONE = 'NONE'
 
 
+_RESPONSE_TYPES = _member_values(ResponseType)
+
+
 def check_response_type(input_value: str):
     """
     Warn if an incorrect response type is passed
     """
-    response_types = _wrap_in_quotes("', '".join([e.value for e in ResponseType]))
     try:
-        output_value = ResponseType[input_value.upper()].value
+        output_value = _RESPONSE_TYPES[input_value.upper()]
     except Exception:
+        response_types = _wrap_in_quotes("', '".join([e.value for e in ResponseType]))
         raise ParameterException(f'response parameter accepts values: {response_types}')
     return output_value
 
@@ -122,14 +144,17 @@ class WriteMethod(Enum):
     UPSERT = 'UPSERT'
 
 
+_WRITE_METHODS = _member_values(WriteMethod)
+
+
 def check_write_method(input_value: str):
     """
     Warn if an incorrect write method is passed
     """
-    write_methods = _wrap_in_quotes("', '".join([e.value for e in WriteMethod]))
     try:
-        output_value = WriteMethod[input_value.upper()].value
+        output_value = _WRITE_METHODS[input_value.upper()]
     except Exception:
+        write_methods = _wrap_in_quotes("', '".join([e.value for e in WriteMethod]))
         raise ParameterException(f'method parameter accepts values: {write_methods}')
     return output_value
 
@@ -143,13 +168,16 @@ class WriteTableType(Enum):
     VIEW = 'VIEW'
 
 
+_WRITE_TABLE_TYPES = _member_values(WriteTableType)
+
+
 def check_write_table_type(input_value: str):
     """
     Warn if an incorrect table type is passed
     """
-    table_types = _wrap_in_quotes("', '".join([e.value for e in WriteTableType]))
     try:
-        output_value = WriteTableType[input_value.upper()].value
+        output_value = _WRITE_TABLE_TYPES[input_value.upper()]
     except Exception:
+        table_types = _wrap_in_quotes("', '".join([e.value for e in WriteTableType]))
         raise ParameterException(f'table_type parameter accepts values: {table_types}')
     return output_value
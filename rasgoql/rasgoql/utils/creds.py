@@ -7,6 +7,16 @@ import yaml
 
 import dotenv
 
+# .env files already loaded into os.environ, mapped to their mtime at load time
+_LOADED_ENV_FILES = {}
+
+
+def clear_env_cache():
+    """
+    Forgets which .env files have been loaded so the next load_env re-reads them
+    """
+    _LOADED_ENV_FILES.clear()
+
 
 def load_env(
     filepath: Path = None,
@@ -14,6 +24,7 @@ def load_env(
 ):
     """
     Loads a .env file, allowing contents to be callable by os.getenv()
+    A file is only parsed again if it has been modified since it was last loaded
     """
     if not filepath:
         filepath = os.getcwd()
@@ -23,7 +34,12 @@ def load_env(
         if not raise_on_missing:
             return
         raise FileNotFoundError(f'File {filepath} does not exist')
+    filepath = os.path.abspath(filepath)
+    modified_time = os.path.getmtime(filepath)
+    if _LOADED_ENV_FILES.get(filepath) == modified_time:
+        return
     dotenv.load_dotenv(filepath)
+    _LOADED_ENV_FILES[filepath] = modified_time
 
 
 def load_yml(
@@ -73,6 +89,7 @@ def save_env(
         f.close()
     for k, v in creds.items():
         dotenv.set_key(filepath, k, v)
+    _LOADED_ENV_FILES.pop(os.path.abspath(filepath), None)
     return filepath
 
 
@@ -25,8 +25,12 @@ def cleanse_sql_dataframe(
 ) -> None:
     """
     Renames all columns in a pandas dataframe to SQL compliant names in place
+    Only string labels are renamed; any other label is left as it is
     """
-    df.rename(columns={r: cleanse_sql_name(r) for r in build_dataframe_schema(df)}, inplace=True)
+    columns = [cleanse_sql_name(column) if isinstance(column, str) else column for column in df.columns]
+    if columns == list(df.columns):
+        return
+    df.columns = columns
 
 
 def generate_dataframe_ddl(
@@ -9,13 +9,18 @@ rql_run_verbose: bool = False
 def verbose_message(
     message: str,
     logger: logging.Logger,
+    *args,
 ) -> None:
     """
     Logs messages only if verbose flag is set to true
+    Pass values to interpolate as `args` with %s placeholders in the message,
+    so large values (like query text) are only formatted when actually logged
     """
-    logger.setLevel(logging.INFO)
     if rql_run_verbose:
-        logger.info(message)
+        # setLevel clears the level cache of every logger, so only call it when needed
+        if not logger.isEnabledFor(logging.INFO):
+            logger.setLevel(logging.INFO)
+        logger.info(message, *args)
 
 
 def set_verbose(
@@ -5,6 +5,8 @@ import random
 import re
 import string
 
+NAMESPACE_PATTERN = re.compile(r'^[^\s]+\.[^\s]+')
+
 
 def cleanse_sql_data_type(
     dtype: str,
@@ -33,9 +35,8 @@ def is_scary_sql(
     """
     Checks a SQL string for presence of injection keywords
     """
-    if any(word in sql.upper() for word in SQL_INJECTION_KEYWORDS):
-        return True
-    return False
+    sql = sql.upper()
+    return any(word in sql for word in SQL_INJECTION_KEYWORDS)
 
 
 def is_restricted_sql(
@@ -44,9 +45,8 @@ def is_restricted_sql(
     """
     Checks a SQL string for presence of dangerous keywords
     """
-    if any(word in sql.upper() for word in SQL_RESTRICTED_KEYWORDS):
-        return True
-    return False
+    sql = sql.upper()
+    return any(word in sql for word in SQL_RESTRICTED_KEYWORDS)
 
 
 def parse_namespace(
@@ -72,7 +72,7 @@ def validate_namespace(
     """
     Accepts a possible namespace string and decides whether it is well-formed
     """
-    if re.match(r'^[^\s]+\.[^\s]+', namespace):
+    if NAMESPACE_PATTERN.match(namespace):
         return namespace
     raise ValueError(f'{namespace} is not a well-formed namespace')
 
@@ -0,0 +1,13 @@
+import pytest
+
+
+@pytest.fixture()
+def test_creds():
+    return {
+        "username": "snek",
+        "password": "slytherin",
+        "host": "local",
+        "port": 66000,
+        "database": "super_prod",
+        "schema": "very_important_schema",
+    }
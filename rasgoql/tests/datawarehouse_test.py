@@ -2,16 +2,7 @@ import os
 
 import pytest
 
-from rasgoql.data import redshift, base, postgres
-
-test_creds = {
-    "username": "snek",
-    "password": "slytherin",
-    "host": "local",
-    "port": 66000,
-    "database": "super_prod",
-    "schema": "very_important_schema",
-}
+from rasgoql.data import base
 
 
 @pytest.fixture()
@@ -19,26 +10,6 @@ def base_dw():
     return base.DataWarehouse()
 
 
-@pytest.fixture()
-def redshift_creds():
-    return redshift.RedshiftCredentials(**test_creds)
-
-
-@pytest.fixture()
-def postgres_creds():
-    return postgres.PostgresCredentials(**test_creds)
-
-
-@pytest.fixture()
-def redshift_dw():
-    return redshift.RedshiftDataWarehouse()
-
-
-@pytest.fixture()
-def postgres_dw():
-    return postgres.PostgresDataWarehouse()
-
-
 def test_parse_fqtn(base_dw):
     # Strict cases
     assert base_dw.parse_fqtn("db.my_scheme.table_name") == ("db", "my_scheme", "table_name")
@@ -56,37 +27,37 @@ def test_parse_fqtn(base_dw):
     assert base_dw.parse_fqtn("full_db.schema.table", "my_db.sch", False) == ("full_db", "schema", "table")
 
 
-def test_creds_from_env():
-    # Populate environment variables with our test data
-    for key, value in test_creds.items():
-        os.environ[f"SOME_BASE_{key}"] = str(value)
+def test_cached_lookup_is_bounded(base_dw, mocker):
+    base_dw.object_cache_size = 2
+    lookup = mocker.Mock(side_effect=lambda fqtn: fqtn.upper())
 
-    parsed_creds = base.DWCredentials._parse_env_vars("SOME_BASE")
-    assert test_creds == parsed_creds
+    assert [base_dw._cached_lookup(name, lookup) for name in ("a", "b", "a", "c")] == ["A", "B", "A", "C"]
+    assert lookup.call_count == 3
+    assert list(base_dw._object_cache) == ["b", "c"]
 
+    base_dw.clear_object_cache()
+    base_dw._cached_lookup("b", lookup)
+    assert lookup.call_count == 4
 
-def test_redshift_creds_from_env(redshift_creds):
-    # Populate environment variables with our test data
-    for key, value in test_creds.items():
-        os.environ[f"REDSHIFT_{key}"] = str(value)
 
-    redshift_creds_from_env = redshift.RedshiftCredentials.from_env()
-    assert redshift_creds.to_dict() == redshift_creds_from_env.to_dict()
+def test_cached_lookup_only_keeps_existing_objects(base_dw, mocker):
+    lookup = mocker.Mock(side_effect=[False, True])
 
+    assert base_dw._cached_lookup("db.sch.t", lookup) is False
+    assert "db.sch.t" not in base_dw._object_cache
+    assert base_dw._cached_lookup("db.sch.t", lookup) is True
+    assert base_dw._cached_lookup("db.sch.t", lookup) is True
+    assert lookup.call_count == 2
 
-def test_redshift_connect(redshift_dw, redshift_creds, mocker):
-    mocker.patch("rasgoql.data.redshift.alchemy_session", return_value="Mocked")
-    mocker.patch("rasgoql.data.sqlalchemy.alchemy_session", return_value="Mocked")
-    redshift_dw.connect(redshift_creds)
-    assert redshift_dw.connection == "Mocked"
-    assert redshift_dw.database == "super_prod"
-    assert redshift_dw.schema == "very_important_schema"
+    base_dw.object_cache_ttl = 0
+    lookup.side_effect = [False]
+    assert base_dw._cached_lookup("db.sch.t", lookup) is False
 
 
-def test_postgres_connect(postgres_dw, postgres_creds, mocker):
-    mocker.patch("rasgoql.data.postgres.alchemy_session", return_value="Mocked")
-    mocker.patch("rasgoql.data.sqlalchemy.alchemy_session", return_value="Mocked")
-    postgres_dw.connect(postgres_creds)
-    assert postgres_dw.connection == "Mocked"
-    assert postgres_dw.database == "super_prod"
-    assert postgres_dw.schema == "very_important_schema"
+def test_creds_from_env(test_creds):
+    # Populate environment variables with our test data
+    for key, value in test_creds.items():
+        os.environ[f"SOME_BASE_{key}"] = str(value)
+
+    parsed_creds = base.DWCredentials._parse_env_vars("SOME_BASE")
+    assert test_creds == parsed_creds
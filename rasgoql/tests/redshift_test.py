@@ -0,0 +1,130 @@
+import os
+
+import pandas as pd
+import pytest
+
+from rasgoql.data import redshift
+
+
+@pytest.fixture()
+def redshift_creds(test_creds):
+    return redshift.RedshiftCredentials(**test_creds)
+
+
+@pytest.fixture()
+def redshift_dw():
+    return redshift.RedshiftDataWarehouse()
+
+
+@pytest.fixture()
+def s3(mocker):
+    mocker.patch.object(redshift, "pa")
+    return mocker.patch.object(redshift, "boto3").client.return_value
+
+
+def test_redshift_creds_from_env(redshift_creds, test_creds):
+    # Populate environment variables with our test data
+    for key, value in test_creds.items():
+        os.environ[f"REDSHIFT_{key}"] = str(value)
+
+    redshift_creds_from_env = redshift.RedshiftCredentials.from_env()
+    assert redshift_creds.to_dict() == redshift_creds_from_env.to_dict()
+
+
+def test_redshift_connect(redshift_dw, redshift_creds, mocker):
+    mocked_engine = mocker.patch("rasgoql.data.redshift.alchemy_engine", return_value="Mocked")
+    redshift_dw.connect(redshift_creds)
+    assert redshift_dw.engine == "Mocked"
+    assert mocked_engine.call_args.kwargs["pool_use_lifo"] is True
+    assert mocked_engine.call_args.kwargs["pool_pre_ping"] is False
+    assert redshift_dw.database == "super_prod"
+    assert redshift_dw.schema == "very_important_schema"
+    assert mocked_engine.call_args.kwargs["connect_args"] == {"application_name": "rasgoql"}
+
+    creds = {**redshift_creds.to_dict(), "conn_params": {"timeout": 5}}
+    redshift_dw.engine = None
+    redshift_dw.connect(creds)
+    assert creds["conn_params"] == {"timeout": 5}
+    assert mocked_engine.call_args.kwargs["connect_args"] == {"timeout": 5, "application_name": "rasgoql"}
+
+
+def test_redshift_write_df_copies_from_s3(redshift_dw, s3, mocker):
+    uploaded = {}
+    mocker.patch.object(
+        redshift_dw,
+        "_upload_parquet",
+        side_effect=lambda s3, bucket, key, df: uploaded.update({key: df["id"].tolist()}),
+    )
+    redshift_dw.credentials = {"s3_bucket": "bucket", "iam_role": "arn:aws:iam::1:role/copy"}
+    redshift_dw._remember_object("db.public.my_table", True)
+    conn = mocker.MagicMock()
+
+    mocker.patch.object(redshift, "COPY_FILE_BYTES", 16)
+    create = "CREATE TABLE public.my_table (id INTEGER)"
+    redshift_dw._write_df(pd.DataFrame({"id": [1, 2, 3, 4]}), conn, "public", "my_table", create)
+
+    keys = sorted(uploaded)
+    prefix = keys[0].rsplit("/", 1)[0] + "/"
+    assert prefix.startswith("rasgoql/copy/")
+    assert uploaded == {f"{prefix}part-00000.parquet": [1, 2], f"{prefix}part-00001.parquet": [3, 4]}
+    assert [call.args[0] for call in conn.exec_driver_sql.call_args_list] == [
+        create,
+        f"COPY public.my_table FROM 's3://bucket/{prefix}' IAM_ROLE 'arn:aws:iam::1:role/copy' FORMAT AS PARQUET",
+    ]
+    s3.delete_objects.assert_called_once_with(Bucket="bucket", Delete={"Objects": [{"Key": key} for key in keys]})
+    # The CREATE changed which tables exist, so cached lookups are dropped
+    assert not redshift_dw._object_cache
+
+
+def test_redshift_write_df_without_s3_falls_back_to_inserts(redshift_dw, mocker):
+    insert = mocker.patch.object(redshift.SQLAlchemyDataWarehouse, "_write_df")
+    redshift_dw.credentials = {}
+    conn = mocker.Mock()
+    df = pd.DataFrame({"id": [1]})
+
+    redshift_dw._write_df(df, conn, "public", "my_table")
+    insert.assert_called_once_with(df, conn, "public", "my_table", None, None)
+
+
+def test_redshift_unloads_large_reads_through_s3(redshift_dw, s3, mocker):
+    s3.get_paginator.return_value.paginate.return_value = [{"Contents": [{"Key": "a"}, {"Key": "b"}]}]
+    mocker.patch.object(redshift_dw, "_read_s3_parquet", side_effect=lambda s3, bucket, key: pd.DataFrame({"k": [key]}))
+    run_query = mocker.patch.object(redshift_dw, "_run_query")
+    redshift_dw.credentials = {"s3_bucket": "bucket", "iam_role": "role"}
+
+    df = redshift_dw.execute_query("SELECT * FROM t WHERE c = 'x';", response="df", via_s3=True)
+
+    prefix = s3.get_paginator.return_value.paginate.call_args.kwargs["Prefix"]
+    assert prefix.startswith("rasgoql/unload/")
+    assert run_query.call_args.args[0] == (
+        f"UNLOAD ('SELECT * FROM t WHERE c = ''x''') TO 's3://bucket/{prefix}' "
+        "IAM_ROLE 'role' FORMAT AS PARQUET PARALLEL ON"
+    )
+    assert sorted(df["k"]) == ["a", "b"]
+    s3.delete_objects.assert_called_once_with(Bucket="bucket", Delete={"Objects": [{"Key": "a"}, {"Key": "b"}]})
+
+
+def test_redshift_unload_batches_stream_one_frame_per_file(redshift_dw, s3, mocker):
+    s3.get_paginator.return_value.paginate.return_value = [{"Contents": [{"Key": "a"}, {"Key": "b"}]}]
+    read = mocker.patch.object(
+        redshift_dw, "_read_s3_parquet", side_effect=lambda s3, bucket, key: pd.DataFrame({"k": [key]})
+    )
+    run_query = mocker.patch.object(redshift_dw, "_run_query")
+    redshift_dw.credentials = {"s3_bucket": "bucket", "iam_role": "role"}
+
+    batches = redshift_dw.execute_query("SELECT * FROM t", response="df", via_s3=True, batches=True)
+    run_query.assert_not_called()
+
+    assert next(batches)["k"].tolist() == ["a"]
+    assert read.call_count == 1
+    s3.delete_objects.assert_not_called()
+    assert [batch["k"].tolist() for batch in batches] == [["b"]]
+    s3.delete_objects.assert_called_once_with(Bucket="bucket", Delete={"Objects": [{"Key": "a"}, {"Key": "b"}]})
+
+
+def test_redshift_via_s3_needs_s3_settings(redshift_dw, mocker):
+    run_query = mocker.patch.object(redshift_dw, "_run_query", return_value="rows")
+    redshift_dw.credentials = {}
+
+    assert redshift_dw.execute_query("SELECT 1", response="df", via_s3=True) == "rows"
+    assert run_query.call_args.args[0] == "SELECT 1"
@@ -0,0 +1,308 @@
+import pandas as pd
+import pytest
+
+from rasgoql.data import snowflake
+
+
+class ProgrammingError(Exception):
+    def __init__(self, errno):
+        self.errno = errno
+
+
+@pytest.fixture()
+def connector(mocker):
+    connector = mocker.patch("rasgoql.data.snowflake.sf_connector")
+    connector.errors.ProgrammingError = ProgrammingError
+    return connector
+
+
+@pytest.fixture()
+def snowflake_dw(mocker):
+    dw = snowflake.SnowflakeDataWarehouse()
+    dw.connection = mocker.MagicMock()
+    return dw
+
+
+def test_snowflake_reconnect_reuses_open_session(connector, mocker):
+    first, second = mocker.MagicMock(), mocker.MagicMock()
+    first.is_closed.return_value = False
+    connector.connect.side_effect = [first, second]
+    dw = snowflake.SnowflakeDataWarehouse()
+    creds = {"user": "snek", "database": "DB", "schema": "SCH"}
+
+    dw.connect(creds)
+    dw.connect(dict(creds))
+    assert connector.connect.call_count == 1
+    assert dw.connection is first
+
+    dw.connect({**creds, "schema": "OTHER"})
+    assert connector.connect.call_count == 2
+    first.close.assert_called_once()
+    assert dw.connection is second
+    assert dw.default_namespace == "DB.OTHER"
+
+
+def test_snowflake_object_details_binds_and_matches_exact_name(snowflake_dw, mocker):
+    rows = [
+        {"name": "MYXTABLE", "kind": "VIEW", "comment": ""},
+        {"name": "MY_TABLE", "kind": "TABLE", "comment": "rasgoql"},
+    ]
+    execute = mocker.patch.object(snowflake_dw, "execute_query", return_value=rows)
+
+    assert snowflake_dw._object_details("DB.SCH.my_table") == (True, True, "TABLE")
+    assert execute.call_args.args[0] == "SHOW OBJECTS LIKE %(table)s IN DB.SCH"
+    assert execute.call_args.kwargs["params"] == {"table": "my_table"}
+
+    execute.return_value = rows[:1]
+    assert snowflake_dw._object_details("DB.SCH.my_table") == (False, False, "unknown")
+
+
+def test_snowflake_object_cache_is_dropped_by_writes(snowflake_dw, mocker):
+    details = mocker.patch.object(snowflake_dw, "_object_details", return_value=(True, False, "TABLE"))
+    run = mocker.patch.object(snowflake_dw, "_run_query")
+
+    assert snowflake_dw.get_object_details("DB.SCH.T") == (True, False, "TABLE")
+    assert snowflake_dw.get_object_details("DB.SCH.T") == (True, False, "TABLE")
+    assert details.call_count == 1
+
+    snowflake_dw.execute_query("DROP TABLE DB.SCH.T", response="None", acknowledge_risk=True)
+    assert run.call_args.args[0] == "DROP TABLE DB.SCH.T"
+    details.return_value = (False, False, "unknown")
+    assert snowflake_dw.get_object_details("DB.SCH.T") == (False, False, "unknown")
+    assert details.call_count == 2
+
+
+def test_snowflake_get_schema_runs_one_desc(snowflake_dw, connector, mocker):
+    execute = mocker.patch.object(snowflake_dw, "execute_query", return_value=[{"name": "ID", "type": "NUMBER(38,0)"}])
+
+    assert snowflake_dw.get_schema("DB.SCH.MY_TABLE") == [("ID", "NUMBER(38,0)")]
+    assert [call.args[0] for call in execute.call_args_list] == ["DESC TABLE DB.SCH.MY_TABLE"]
+
+    execute.side_effect = ProgrammingError(snowflake.OBJECT_DOES_NOT_EXIST)
+    with pytest.raises(snowflake.TableAccessError):
+        snowflake_dw.get_schema("DB.SCH.MISSING")
+
+
+def test_snowflake_list_tables_multi(snowflake_dw, mocker):
+    list_tables = mocker.patch.object(
+        snowflake_dw,
+        "list_tables",
+        side_effect=lambda database, schema: pd.DataFrame({"FQTN": [f"{database}.{schema}.T"]}),
+    )
+
+    result = snowflake_dw.list_tables_multi(["DB1.SCH1", "DB2.SCH2"])
+    assert result["FQTN"].tolist() == ["DB1.SCH1.T", "DB2.SCH2.T"]
+    assert sorted(call.args for call in list_tables.call_args_list) == [("DB1", "SCH1"), ("DB2", "SCH2")]
+
+
+def test_snowflake_create_lets_server_detect_conflicts(snowflake_dw, connector, mocker):
+    execute = mocker.patch.object(snowflake_dw, "execute_query")
+
+    assert snowflake_dw.create("SELECT 1 AS ID", "DB.SCH.MY_VIEW") == "DB.SCH.MY_VIEW"
+    assert [call.args[0] for call in execute.call_args_list] == [
+        "CREATE VIEW DB.SCH.MY_VIEW COMMENT='rasgoql' AS SELECT 1 AS ID"
+    ]
+
+    execute.side_effect = ProgrammingError(snowflake.OBJECT_ALREADY_EXISTS)
+    with pytest.raises(snowflake.TableConflictException, match="DB.SCH.MY_VIEW"):
+        snowflake_dw.create("SELECT 1 AS ID", "DB.SCH.MY_VIEW")
+
+
+def test_snowflake_create_remembers_new_object(snowflake_dw, mocker):
+    execute = mocker.patch.object(snowflake_dw, "execute_query")
+
+    snowflake_dw.create("SELECT 1 AS ID", "DB.SCH.MY_VIEW", overwrite=True)
+    assert execute.call_args.args[0] == "CREATE OR REPLACE VIEW DB.SCH.MY_VIEW COMMENT='rasgoql' AS SELECT 1 AS ID"
+    execute.reset_mock()
+    assert snowflake_dw.get_object_details("DB.SCH.MY_VIEW") == (True, True, "VIEW")
+    assert snowflake_dw._table_exists("DB.SCH.MY_VIEW")
+    execute.assert_not_called()
+
+
+def test_snowflake_create_async_then_wait(snowflake_dw, mocker):
+    cursor = snowflake_dw.connection.cursor.return_value.__enter__.return_value
+    cursor.sfqid = "01-abc"
+    snowflake_dw.connection.is_still_running.side_effect = [True, False]
+    mocker.patch.object(snowflake, "POLL_INTERVAL", 0)
+
+    fqtn = snowflake_dw.create_async("SELECT 1 AS ID", "DB.SCH.MY_TABLE", "table", overwrite=True)
+    assert fqtn == "DB.SCH.MY_TABLE"
+    cursor.execute_async.assert_called_once_with(
+        "CREATE OR REPLACE TABLE DB.SCH.MY_TABLE COMMENT='rasgoql' AS SELECT 1 AS ID"
+    )
+    assert snowflake_dw._pending == {"DB.SCH.MY_TABLE": ("01-abc", "TABLE")}
+
+    snowflake_dw.wait()
+    assert snowflake_dw.connection.is_still_running.call_count == 2
+    assert snowflake_dw.get_object_details("DB.SCH.MY_TABLE") == (True, True, "TABLE")
+    assert not snowflake_dw._pending
+
+
+def test_snowflake_wait_resolves_every_pending_create(snowflake_dw, connector):
+    snowflake_dw.connection.is_still_running.return_value = False
+    snowflake_dw.connection.get_query_status_throw_if_error.side_effect = [
+        ProgrammingError(snowflake.OBJECT_ALREADY_EXISTS),
+        1,
+    ]
+    snowflake_dw._pending = {"DB.SCH.FIRST": ("01-a", "VIEW"), "DB.SCH.SECOND": ("01-b", "TABLE")}
+
+    with pytest.raises(snowflake.TableConflictException, match="DB.SCH.FIRST"):
+        snowflake_dw.wait()
+    statuses = snowflake_dw.connection.get_query_status_throw_if_error.call_args_list
+    assert [call.args[0] for call in statuses] == ["01-a", "01-b"]
+    assert not snowflake_dw._pending
+    assert snowflake_dw.get_object_details("DB.SCH.SECOND") == (True, True, "TABLE")
+
+    with pytest.raises(snowflake.ParameterException, match="DB.SCH.FIRST"):
+        snowflake_dw.wait("DB.SCH.FIRST")
+
+
+def test_snowflake_create_batch_submits_once(snowflake_dw, mocker):
+    cursor = snowflake_dw.connection.cursor.return_value.__enter__.return_value
+    show = mocker.patch.object(snowflake_dw, "execute_query", return_value=[{"name": "OLD_VIEW"}])
+    items = [
+        ("SELECT 1 AS ID", "DB.SCH.FIRST", "view"),
+        ("SELECT ID FROM DB.SCH.FIRST", "DB.SCH.SECOND", "table"),
+    ]
+
+    assert snowflake_dw.create_batch(items) == ["DB.SCH.FIRST", "DB.SCH.SECOND"]
+    assert [call.args[0] for call in show.call_args_list] == ["SHOW OBJECTS IN DB.SCH"]
+    cursor.execute.assert_called_once_with(
+        "CREATE VIEW DB.SCH.FIRST COMMENT='rasgoql' AS SELECT 1 AS ID;\n"
+        "CREATE TABLE DB.SCH.SECOND COMMENT='rasgoql' AS SELECT ID FROM DB.SCH.FIRST",
+        num_statements=2,
+    )
+    assert snowflake_dw.get_object_details("DB.SCH.SECOND") == (True, True, "TABLE")
+
+    with pytest.raises(snowflake.TableConflictException, match="DB.SCH.OLD_VIEW"):
+        snowflake_dw.create_batch([("SELECT 1", "DB.SCH.OLD_VIEW", "view")])
+
+
+def test_snowflake_save_df_rechecks_missing_tables(snowflake_dw, mocker):
+    details = mocker.patch.object(snowflake_dw, "_object_details", return_value=(False, False, "unknown"))
+    assert snowflake_dw.get_object_details("DB.SCH.MY_TABLE") == (False, False, "unknown")
+
+    # Another session creates the table: the missing answer was not kept
+    details.return_value = (True, True, "TABLE")
+    with pytest.raises(snowflake.TableConflictException, match="DB.SCH.MY_TABLE"):
+        snowflake_dw.save_df(pd.DataFrame({"ID": [1]}), "DB.SCH.MY_TABLE")
+    assert details.call_count == 2
+
+    # Tables known to exist are answered from the cache
+    assert snowflake_dw.get_object_details("DB.SCH.MY_TABLE") == (True, True, "TABLE")
+    assert details.call_count == 2
+
+
+def test_snowflake_save_df_puts_one_directory(snowflake_dw, mocker):
+    cursor = snowflake_dw.connection.cursor.return_value.__enter__.return_value
+    mocker.patch.object(snowflake_dw, "_table_exists", return_value=True)
+    to_parquet = mocker.patch.object(pd.DataFrame, "to_parquet", autospec=True)
+
+    fqtn = snowflake_dw.save_df(pd.DataFrame({"id": [1, 2, 3]}), "DB.SCH.MY_TABLE", method="append", chunksize=2)
+    assert fqtn == "DB.SCH.MY_TABLE"
+
+    assert [call.args[0]["id"].tolist() for call in to_parquet.call_args_list] == [[1, 2], [3]]
+    paths = [call.args[1] for call in to_parquet.call_args_list]
+    directory = paths[0].rsplit("/", 1)[0]
+    assert paths == [f"{directory}/part-00000.parquet", f"{directory}/part-00001.parquet"]
+
+    statements = [call.args[0] for call in cursor.execute.call_args_list]
+    stage = statements[0].split()[3]
+    assert stage.startswith("DB.SCH.RQL_STAGE_")
+    assert statements == [
+        f"CREATE TEMPORARY STAGE {stage} FILE_FORMAT=(TYPE=PARQUET)",
+        f"PUT 'file://{directory}/*' @{stage} PARALLEL=8 AUTO_COMPRESS=FALSE",
+        f"COPY INTO DB.SCH.MY_TABLE FROM @{stage} "
+        "FILE_FORMAT=(TYPE=PARQUET USE_VECTORIZED_SCANNER=TRUE) MATCH_BY_COLUMN_NAME=CASE_INSENSITIVE",
+        f"DROP STAGE IF EXISTS {stage}",
+    ]
+
+
+def test_snowflake_preview_leaves_percent_literals_alone(snowflake_dw):
+    cursor = snowflake_dw.connection.cursor.return_value
+    cursor.fetch_pandas_all.return_value = pd.DataFrame({"NAME": ["xx"]})
+
+    assert snowflake_dw.preview("SELECT NAME FROM T WHERE NAME LIKE '%x%'", limit=5)["NAME"].tolist() == ["xx"]
+    cursor.execute.assert_called_once_with(
+        "SELECT * FROM (SELECT NAME FROM T WHERE NAME LIKE '%x%') AS rql_preview LIMIT 5",
+        None,
+    )
+
+
+def test_snowflake_preview_many_sends_one_request(snowflake_dw):
+    cursor = snowflake_dw.connection.cursor.return_value.__enter__.return_value
+    first, second = pd.DataFrame({"A": [1]}), pd.DataFrame({"B": [2]})
+    cursor.fetch_pandas_all.side_effect = [first, second]
+    cursor.nextset.side_effect = [True, None]
+
+    assert snowflake_dw.preview_many(["SELECT A FROM T1;", "SELECT B FROM T2"], limit=5) == [first, second]
+    cursor.execute.assert_called_once_with(
+        "SELECT * FROM (SELECT A FROM T1) AS rql_preview LIMIT 5;\n"
+        "SELECT * FROM (SELECT B FROM T2) AS rql_preview LIMIT 5",
+        num_statements=2,
+    )
+
+
+def test_snowflake_streams_dict_rows(snowflake_dw, connector):
+    cursor = snowflake_dw.connection.cursor.return_value
+    cursor.__iter__.return_value = iter([{"ID": 1}, {"ID": 2}])
+
+    rows = snowflake_dw.execute_query("SELECT ID FROM T", response="dict", batches=True)
+    # Nothing runs until the first row is asked for
+    cursor.execute.assert_not_called()
+    assert list(rows) == [{"ID": 1}, {"ID": 2}]
+    snowflake_dw.connection.cursor.assert_called_once_with(connector.DictCursor)
+    cursor.execute.assert_called_once_with("SELECT ID FROM T", None)
+    cursor.fetchall.assert_not_called()
+    cursor.close.assert_called_once()
+
+
+def test_snowflake_streams_each_statement(snowflake_dw, mocker):
+    first, second = mocker.MagicMock(), mocker.MagicMock()
+    first.__iter__.return_value = iter([(1,)])
+    second.__iter__.return_value = iter([(2,)])
+    snowflake_dw.connection.execute_stream.return_value = iter([first, second])
+
+    rows = snowflake_dw.execute_query("SELECT 1; SELECT 2", batches=True)
+    assert next(rows) == (1,)
+    second.__enter__.assert_not_called()
+    assert list(rows) == [(2,)]
+    assert snowflake_dw.connection.execute_stream.call_args.args[0].getvalue() == "SELECT 1; SELECT 2"
+
+
+def test_snowflake_result_cache_is_opt_in(snowflake_dw, mocker):
+    run = mocker.patch.object(snowflake_dw, "_run_query", side_effect=lambda *args: pd.DataFrame({"ID": [1]}))
+
+    snowflake_dw.execute_query("SELECT ID FROM T", response="df")
+    snowflake_dw.execute_query("SELECT ID FROM T", response="df")
+    assert run.call_count == 2
+
+    snowflake_dw.result_cache_ttl = 60
+    first = snowflake_dw.execute_query("SELECT ID FROM T", response="df")
+    first["ID"] = 2
+    assert snowflake_dw.execute_query("SELECT ID FROM T", response="df")["ID"].tolist() == [1]
+    assert run.call_count == 3
+
+    snowflake_dw.execute_query("SELECT ID FROM T", response="df", bypass_cache=True)
+    assert run.call_count == 4
+
+
+def test_snowflake_result_cache_follows_writes(snowflake_dw, mocker):
+    snowflake_dw.result_cache_ttl = 60
+    rows = [[{"NAME": "T"}], [{"NAME": "T"}, {"NAME": "U"}]]
+    run = mocker.patch.object(snowflake_dw, "_run_query", side_effect=lambda *args: list(rows[0]))
+
+    assert snowflake_dw.execute_query("SELECT NAME FROM T", response="dict") == [{"NAME": "T"}]
+    rows.pop(0)
+    cached = snowflake_dw.execute_query("SELECT NAME FROM T", response="dict")
+    assert cached == [{"NAME": "T"}]
+    cached[0]["NAME"] = "CHANGED"
+    assert snowflake_dw.execute_query("SELECT NAME FROM T", response="dict") == [{"NAME": "T"}]
+
+    snowflake_dw.execute_query("INSERT INTO T VALUES ('U')", response="None", acknowledge_risk=True)
+    assert snowflake_dw.execute_query("SELECT NAME FROM T", response="dict") == [{"NAME": "T"}, {"NAME": "U"}]
+
+    # SHOW output must see creates and drops, so it is never cached
+    snowflake_dw.execute_query("SHOW TABLES IN DB.SCH", response="dict")
+    snowflake_dw.execute_query("SHOW TABLES IN DB.SCH", response="dict")
+    assert [call.args[0] for call in run.call_args_list][-2:] == ["SHOW TABLES IN DB.SCH", "SHOW TABLES IN DB.SCH"]
@@ -0,0 +1,134 @@
+import pandas as pd
+import pytest
+
+from rasgoql.data import sqlalchemy
+from rasgoql.data.sqlalchemy import SQLAlchemyDataWarehouse
+from rasgoql.imports import alchemy_engine
+
+
+class SQLiteDataWarehouse(SQLAlchemyDataWarehouse):
+    def connect(self, credentials):
+        super().connect(credentials)
+
+    def _object_exists_sql(self, schema, table):
+        return "SELECT name FROM sqlite_master WHERE name = :table", {"table": table}
+
+    @property
+    def _engine(self):
+        return alchemy_engine("sqlite://")
+
+
+@pytest.fixture()
+def sqlite_dw():
+    dw = SQLiteDataWarehouse()
+    dw.connect({"database": "main", "schema": "main"})
+    dw.execute_query("CREATE TABLE things (id INTEGER)", response="None", acknowledge_risk=True)
+    dw.execute_query("INSERT INTO things VALUES (1), (2), (3)", response="None", acknowledge_risk=True)
+    return dw
+
+
+def test_sqlalchemy_queries_against_sqlite(sqlite_dw):
+    assert sqlite_dw.execute_query("SELECT 1 AS one", response="dict") == [{"one": 1}]
+    assert sqlite_dw.execute_query("SELECT id FROM things WHERE id > :low", params={"low": 1}) == [(2,), (3,)]
+    assert sqlite_dw.get_object_details("main.main.things")[0] is True
+    assert sqlite_dw.get_object_details("main.main.missing")[0] is False
+
+
+def test_sqlalchemy_preview_inlines_limit(sqlite_dw, mocker):
+    assert sqlite_dw.preview("SELECT * FROM things LIMIT 2;", limit=5)["id"].tolist() == [1, 2]
+    assert sqlite_dw.preview("SELECT * FROM things", limit=1)["id"].tolist() == [1]
+
+    execute = mocker.spy(sqlite_dw, "execute_query")
+    sqlite_dw.preview("SELECT * FROM things", limit="2")
+    execute.assert_called_once_with(
+        "SELECT * FROM (SELECT * FROM things) AS rql_preview LIMIT 2", response="df", acknowledge_risk=True
+    )
+
+
+def test_sqlalchemy_connection_block_shares_one_checkout(sqlite_dw, mocker):
+    checkouts = mocker.spy(sqlite_dw.engine, "connect")
+    with sqlite_dw._connection():
+        assert sqlite_dw._table_exists("main.main.things")
+        assert len(sqlite_dw.execute_query("SELECT * FROM things")) == 3
+    assert checkouts.call_count == 1
+
+
+def test_sqlalchemy_object_cache_follows_writes(sqlite_dw, mocker):
+    lookups = mocker.spy(sqlite_dw, "_lookup_table_exists")
+
+    # Missing tables are always asked about again
+    assert sqlite_dw._table_exists("main.main.other") is False
+    assert sqlite_dw._table_exists("main.main.other") is False
+    assert lookups.call_count == 2
+
+    sqlite_dw.execute_query("CREATE TABLE other (id INTEGER)", response="None", acknowledge_risk=True)
+    assert sqlite_dw._table_exists("main.main.other") is True
+    assert sqlite_dw._table_exists("main.main.other") is True
+    assert lookups.call_count == 3
+
+    # A write through execute_query drops the cached answer
+    sqlite_dw.execute_query("DROP TABLE other", response="None", acknowledge_risk=True)
+    assert sqlite_dw._table_exists("main.main.other") is False
+    assert lookups.call_count == 4
+
+
+def test_sqlalchemy_write_df_creates_and_loads(sqlite_dw):
+    with sqlite_dw._connection() as conn:
+        sqlite_dw._write_df(pd.DataFrame({"id": [4, 5]}), conn, None, "loaded", "CREATE TABLE loaded (id INTEGER)")
+    assert sqlite_dw.execute_query("SELECT id FROM loaded ORDER BY id") == [(4,), (5,)]
+
+
+def test_sqlalchemy_list_tables(sqlite_dw, mocker):
+    listing = pd.DataFrame({"table_name": ["a", "b"], "table_type": ["TABLE", "VIEW"]})
+    execute = mocker.patch.object(sqlite_dw, "execute_query", return_value=listing)
+
+    assert sqlite_dw.list_tables()["table_type"].dtype == "category"
+    assert execute.call_args.args[0] == (
+        "SELECT TABLE_NAME, TABLE_CATALOG||'.'||TABLE_SCHEMA||'.'||TABLE_NAME AS FQTN, "
+        "CASE TABLE_TYPE WHEN 'BASE TABLE' THEN 'TABLE' ELSE TABLE_TYPE END AS TABLE_TYPE "
+        "FROM INFORMATION_SCHEMA.TABLES"
+    )
+    assert execute.call_args.kwargs["params"] is None
+
+    sqlite_dw.list_tables(database="analytics", schema="public")
+    assert execute.call_args.args[0].endswith(" FROM ANALYTICS.INFORMATION_SCHEMA.TABLES WHERE TABLE_SCHEMA = :schema")
+    assert execute.call_args.kwargs["params"] == {"schema": "PUBLIC"}
+
+
+def test_sqlalchemy_reconnect_and_close_dispose_engine(sqlite_dw, mocker):
+    first_engine = sqlite_dw.engine
+    dispose = mocker.spy(first_engine, "dispose")
+    sqlite_dw.connect({"database": "main", "schema": "main"})
+    assert sqlite_dw.engine is not first_engine
+    dispose.assert_called_once()
+
+    with sqlite_dw:
+        pass
+    assert sqlite_dw.engine is None
+
+
+def test_sqlalchemy_retries_reads_on_dropped_connection(sqlite_dw, mocker):
+    from sqlalchemy import exc
+
+    dropped = exc.OperationalError("SELECT 1", {}, Exception("closed"), connection_invalidated=True)
+    query = mocker.patch.object(sqlite_dw, "_query_into_dict", side_effect=[dropped, [{"one": 1}]])
+    assert sqlite_dw.execute_query("SELECT 1", response="dict") == [{"one": 1}]
+    assert query.call_count == 2
+
+    execute = mocker.patch.object(sqlite_dw, "_execute_string", side_effect=dropped)
+    with pytest.raises(exc.OperationalError):
+        sqlite_dw.execute_query("INSERT INTO things VALUES (4)", acknowledge_risk=True)
+    assert execute.call_count == 1
+
+
+def test_sqlalchemy_arrow_response_converts_dataframe(sqlite_dw, mocker):
+    pa = mocker.patch.object(sqlalchemy, "pa")
+
+    assert sqlite_dw.execute_query("SELECT id FROM things", response="arrow") is pa.Table.from_pandas.return_value
+    df = pa.Table.from_pandas.call_args.args[0]
+    assert df["id"].tolist() == [1, 2, 3]
+    assert pa.Table.from_pandas.call_args.kwargs == {"preserve_index": False}
+
+    mocker.patch.object(sqlalchemy, "pa", None)
+    with pytest.raises(sqlalchemy.PackageDependencyWarning):
+        sqlite_dw.execute_query("SELECT id FROM things", response="arrow")
@@ -0,0 +1,38 @@
+import pandas as pd
+
+from rasgoql.data import base
+from rasgoql.utils import creds
+from rasgoql.utils.df import cleanse_sql_dataframe
+from rasgoql.utils.sql import cleanse_sql_name
+
+
+def test_load_env_only_parses_changed_files(tmp_path, mocker):
+    env_file = tmp_path / ".env"
+    env_file.write_text("SOME_CACHED_VAR=1\n")
+    load_dotenv = mocker.patch("rasgoql.utils.creds.dotenv.load_dotenv")
+
+    creds.load_env(str(env_file))
+    creds.load_env(str(env_file))
+    assert load_dotenv.call_count == 1
+
+    base.DWCredentials.clear_env_cache()
+    creds.load_env(str(env_file))
+    assert load_dotenv.call_count == 2
+
+
+def test_cleanse_sql_dataframe_matches_cleanse_sql_name():
+    names = ["first name", "last-name", '"quoted"', "dotted.col", "index"]
+    df = pd.DataFrame([[1, 2, 3, 4, 5]], columns=names)
+    cleanse_sql_dataframe(df)
+    assert list(df.columns) == [cleanse_sql_name(name) for name in names]
+
+
+def test_cleanse_sql_dataframe_keeps_non_string_labels():
+    df = pd.DataFrame([[1, 2, 3]], columns=["a b", 2, ("x", "y")])
+    cleanse_sql_dataframe(df)
+    assert list(df.columns) == ["a_b", 2, ("x", "y")]
+
+    clean = pd.DataFrame([[1, 2]], columns=["a", 2])
+    index = clean.columns
+    cleanse_sql_dataframe(clean)
+    assert clean.columns is index